@@ -31,13 +31,10 @@ async def get_ai_service(
     """
     Dependency provider for AIService.
     
-    Creates an AIService instance with proper configuration and cleanup.
+    Creates an AIService instance with proper configuration. Its HTTP and
+    Redis connections are shared process-wide and closed at shutdown.
     """
-    service = AIService(settings)
-    try:
-        yield service
-    finally:
-        await service.client.aclose()
+    yield AIService(settings)
 
 async def get_prompt_filter_service(
     settings: Settings = Depends(get_settings)
@@ -74,10 +71,10 @@ async def get_chat_service(
         # Any cleanup needed for the chat service
         pass
 
-def get_tenant_service() -> TenantService:
+async def get_tenant_service() -> TenantService:
     """Dependency for getting a TenantService instance."""
     return TenantService()
 
-def get_bot_service() -> ChatbotInstanceService:
+async def get_bot_service() -> ChatbotInstanceService:
     """Dependency for ChatbotInstanceService."""
     return ChatbotInstanceService()
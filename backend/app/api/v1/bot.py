@@ -6,7 +6,7 @@ from app.schemas.bot import (
     ChatbotInstanceCreate,
     ChatbotInstanceResponse,
 )
-from app.schemas.chat import BotConversationsListResponse, BotConversationResponse
+from app.schemas.chat import BotConversationsListResponse
 from app.services.auth import get_current_user, UserToken, AuthService
 from app.core.security.tenancy import require_tenant
 from app.services.bot import ChatbotInstanceService
@@ -141,14 +141,7 @@ async def get_bot_conversations(
         )
         
         # Convert to response model format
-        conversation_responses = [
-            BotConversationResponse(**conv) for conv in conversations
-        ]
-        
-        return BotConversationsListResponse(
-            conversations=conversation_responses,
-            total=len(conversation_responses)  # In a real implementation, would get actual total count
-        )
+        return BotConversationsListResponse.from_rows(conversations)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -8,7 +8,7 @@ from app.schemas import (
     FeedbackRequest,
     FeedbackResponse,
 )
-from app.schemas.chat import BotConversationsListResponse, BotConversationResponse
+from app.schemas.chat import BotConversationsListResponse
 from app.services.auth import get_current_user, get_current_user_roles, UserToken, AuthService
 from app.core.security.tenancy import require_tenant
 from app.services.chat import ChatService
@@ -112,14 +112,7 @@ async def get_bot_conversations(
         )
         
         # Convert to response model format
-        conversation_responses = [
-            BotConversationResponse(**conv) for conv in conversations
-        ]
-        
-        return BotConversationsListResponse(
-            conversations=conversation_responses,
-            total=len(conversation_responses)  # In a real implementation, would get actual total count
-        )
+        return BotConversationsListResponse.from_rows(conversations)
     except Exception as e:
         logger.error(f"Error getting bot conversations: {str(e)}")
         raise HTTPException(
@@ -61,7 +61,7 @@ async def keycloak_webhook(
     processes the event accordingly.
     """
     if not is_valid:
-        await log_security_event(
+        log_security_event(
             event_type="INVALID_WEBHOOK_SIGNATURE",
             details={"event_type": event.type},
             severity="ERROR"
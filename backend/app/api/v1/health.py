@@ -1,12 +1,24 @@
 from typing import Dict
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 from tortoise import connections
+import orjson
 import redis
 from app.core.config import get_settings
 
 router = APIRouter()
 settings = get_settings()
 
+# Health bodies keyed by (database up, redis up), serialized once
+_HEALTH_BODIES = {
+    (db_healthy, redis_healthy): orjson.dumps({
+        "status": "healthy" if db_healthy and redis_healthy else "unhealthy",
+        "database": "up" if db_healthy else "down",
+        "redis": "up" if redis_healthy else "down"
+    })
+    for db_healthy in (True, False)
+    for redis_healthy in (True, False)
+}
+
 async def check_database() -> bool:
     try:
         conn = connections.get("default")
@@ -38,10 +50,7 @@ async def health_check():
     db_healthy = await check_database()
     redis_healthy = await check_redis()
     
-    status = "healthy" if db_healthy and redis_healthy else "unhealthy"
-    
-    return {
-        "status": status,
-        "database": "up" if db_healthy else "down",
-        "redis": "up" if redis_healthy else "down"
-    } 
\ No newline at end of file
+    return Response(
+        _HEALTH_BODIES[(db_healthy, redis_healthy)],
+        media_type="application/json"
+    )
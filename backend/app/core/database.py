@@ -1,5 +1,6 @@
 from typing import Dict, Any
 from tortoise import Tortoise
+from tortoise.queryset import QuerySet
 from app.core.config.settings import get_settings
 
 TORTOISE_ORM: Dict[str, Any] = {
@@ -33,6 +34,14 @@ TORTOISE_ORM: Dict[str, Any] = {
     "timezone": "UTC"
 }
 
+# Foreign keys read by the chat endpoints. Tortoise loads relations lazily, so
+# queries that hand conversations to those endpoints should join them up front.
+CHAT_RELATIONS = ("user", "chatbot_instance")
+
+def with_chat_relations(queryset: QuerySet) -> QuerySet:
+    """Join the chat relations into the given queryset (one query instead of N+1)."""
+    return queryset.select_related(*CHAT_RELATIONS)
+
 async def initialize_database() -> None:
     """Initialize the database connection with Tortoise ORM."""
     settings = get_settings()
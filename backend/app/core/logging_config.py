@@ -13,114 +13,80 @@ Features:
 - Error tracking and alerting
 """
 
+import asyncio
 import logging
 import logging.config
 import structlog
 import sys
 import os
-from typing import Dict, Any, Optional
-from datetime import datetime
-import json
+import queue
+import threading
+from typing import Callable, Dict, Any, Optional
+import orjson
 from contextlib import contextmanager
 
 # Global logger instance
 logger = structlog.get_logger(__name__)
 
-class LokiJSONFormatter(logging.Formatter):
-    """
-    Custom JSON formatter optimized for Loki ingestion.
-    
-    Provides consistent field naming and structure for Loki labels.
-    """
-    
-    def format(self, record: logging.LogRecord) -> str:
-        """Format log record as JSON with Loki-friendly structure."""
-        
-        # Base log entry
-        log_entry = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-            "level": record.levelname,
-            "logger": record.name,
-            "message": record.getMessage(),
-            "module": record.module,
-            "function": record.funcName,
-            "line": record.lineno,
-        }
-        
-        # Add exception info if present
-        if record.exc_info:
-            log_entry["exception"] = self.formatException(record.exc_info)
-        
-        # Add extra fields from the record
-        for key, value in record.__dict__.items():
-            if key not in {
-                'name', 'msg', 'args', 'levelname', 'levelno', 'pathname', 
-                'filename', 'module', 'lineno', 'funcName', 'created', 
-                'msecs', 'relativeCreated', 'thread', 'threadName', 
-                'processName', 'process', 'exc_info', 'exc_text', 'stack_info'
-            }:
-                log_entry[key] = value
-        
-        # Ensure all values are JSON serializable
-        try:
-            return json.dumps(log_entry, default=str, ensure_ascii=False)
-        except (TypeError, ValueError) as e:
-            # Fallback to simple message if JSON serialization fails
-            fallback = {
-                "timestamp": datetime.utcnow().isoformat() + "Z",
-                "level": "ERROR",
-                "logger": "logging_config",
-                "message": f"Failed to serialize log entry: {str(e)}",
-                "original_message": str(record.getMessage())
-            }
-            return json.dumps(fallback)
+# Directory for the file handler
+LOG_DIR = "/app/logs"
 
-class RequestContextProcessor:
-    """
-    Processor to add request context to all log entries.
-    """
-    
-    def __init__(self):
-        self.request_id = None
-        self.user_id = None
-        self.tenant_id = None
-        self.endpoint = None
-    
-    def __call__(self, logger, method_name, event_dict):
-        """Add request context to event dictionary."""
-        
-        # Add context if available
-        if hasattr(self, 'request_id') and self.request_id:
-            event_dict['request_id'] = self.request_id
-        if hasattr(self, 'user_id') and self.user_id:
-            event_dict['user_id'] = self.user_id
-        if hasattr(self, 'tenant_id') and self.tenant_id:
-            event_dict['tenant_id'] = self.tenant_id
-        if hasattr(self, 'endpoint') and self.endpoint:
-            event_dict['endpoint'] = self.endpoint
-            
-        return event_dict
+# Set once setup_logging has run, so repeated imports/calls don't reconfigure
+_CONFIGURED = False
+
+def _orjson_render(event_dict: Dict[str, Any], **kwargs: Any) -> str:
+    """Serialize a stdlib record's event dict with orjson for a text handler."""
+    return orjson.dumps(event_dict, **kwargs).decode()
+
+# Processors turning a stdlib LogRecord (tortoise, uvicorn, ...) into the
+# same event dict shape structlog loggers produce
+_STDLIB_PRE_CHAIN = [
+    structlog.contextvars.merge_contextvars,
+    structlog.stdlib.add_log_level,
+    structlog.stdlib.add_logger_name,
+    structlog.stdlib.ExtraAdder(),
+    structlog.processors.TimeStamper(fmt="iso", utc=True),
+]
+
+def _upper_case_level(logger, method_name, event_dict):
+    """Render the level as the stdlib level name (``INFO``), as Loki expects."""
+    event_dict["level"] = event_dict["level"].upper()
+    return event_dict
 
-# Global request context processor instance
-request_context = RequestContextProcessor()
+# Log methods whose records may carry stack or exception info
+_ERROR_METHODS = frozenset({"exception", "error", "critical"})
+_stack_info_renderer = structlog.processors.StackInfoRenderer()
 
-def configure_structlog():
-    """Configure structlog for consistent structured logging."""
+def _add_error_context(logger, method_name, event_dict):
+    """Run the stack/exception-info processors for error-level records only."""
+    if method_name in _ERROR_METHODS:
+        event_dict = structlog.dev.set_exc_info(logger, method_name, event_dict)
+        return _stack_info_renderer(logger, method_name, event_dict)
+    return event_dict
+
+def configure_structlog(level: int = logging.INFO):
+    """
+    Configure structlog for consistent structured logging.
+    
+    Args:
+        level: Minimum numeric log level; calls below it return before any
+            processor runs
+    """
     
     structlog.configure(
         processors=[
             structlog.contextvars.merge_contextvars,
             structlog.processors.add_log_level,
-            structlog.processors.StackInfoRenderer(),
-            structlog.dev.set_exc_info,
-            structlog.processors.TimeStamper(fmt="iso"),
-            request_context,
-            structlog.processors.JSONRenderer()
+            _add_error_context,
+            structlog.processors.TimeStamper(fmt="iso", utc=True),
+            # orjson renders straight to bytes, which BytesLogger writes to
+            # stdout's buffer without another str -> bytes encode
+            structlog.processors.JSONRenderer(serializer=orjson.dumps)
         ],
-        wrapper_class=structlog.make_filtering_bound_logger(logging.INFO),
+        wrapper_class=structlog.make_filtering_bound_logger(level),
         context_class=dict,
-        logger_factory=structlog.WriteLoggerFactory(),
-        cache_logger_on_first_use=False,
+        logger_factory=structlog.BytesLoggerFactory(),
+        cache_logger_on_first_use=True,
     )
 
 def setup_logging(
@@ -136,17 +102,42 @@ def setup_logging(
         service_name: Name of the service for labeling
         environment: Environment name (development, staging, production)
     """
+    global _CONFIGURED
+    if _CONFIGURED:
+        return
+    
+    # In production Promtail ships container stdout, so the file handler
+    # would only duplicate every record. Elsewhere, create the logs directory
+    # and fall back to console-only logging where it can't be created
+    # (e.g. tests without /app)
+    handlers = ["console"]
+    if environment != "production":
+        try:
+            os.makedirs(LOG_DIR, exist_ok=True)
+            handlers.append("file")
+        except OSError:
+            pass
     
     # Configure structlog first
-    configure_structlog()
+    configure_structlog(getattr(logging, log_level.upper(), logging.INFO))
     
     # Logging configuration dictionary
     config = {
         "version": 1,
         "disable_existing_loggers": False,
         "formatters": {
+            # stdlib records share structlog's orjson renderer but keep the
+            # "message" key and upper-case level documented for Loki queries
             "loki_json": {
-                "()": LokiJSONFormatter,
+                "()": structlog.stdlib.ProcessorFormatter,
+                "foreign_pre_chain": _STDLIB_PRE_CHAIN,
+                "processors": [
+                    structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+                    structlog.processors.EventRenamer("message"),
+                    _upper_case_level,
+                    structlog.processors.format_exc_info,
+                    structlog.processors.JSONRenderer(serializer=_orjson_render),
+                ],
             },
             "console": {
                 "format": "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
@@ -161,70 +152,50 @@ def setup_logging(
                 "level": log_level
             },
             "file": {
-                "class": "logging.handlers.RotatingFileHandler",
+                # Rotation is done externally (logrotate), the handler
+                # just reopens the file once it has been moved
+                "class": "logging.handlers.WatchedFileHandler",
                 "formatter": "loki_json",
-                "filename": "/app/logs/app.log",
-                "maxBytes": 10485760,  # 10MB
-                "backupCount": 5,
+                "filename": os.path.join(LOG_DIR, "app.log"),
                 "level": log_level
             }
         },
         "loggers": {
-            # Application loggers
+            # Application loggers; app.* children inherit level and
+            # propagate to the root handlers, so each record is formatted once
             "app": {
-                "handlers": ["console", "file"],
                 "level": log_level,
-                "propagate": False
-            },
-            "app.services": {
-                "handlers": ["console", "file"],
-                "level": log_level,
-                "propagate": False
-            },
-            "app.api": {
-                "handlers": ["console", "file"],
-                "level": log_level,
-                "propagate": False
-            },
-            "app.core": {
-                "handlers": ["console", "file"],
-                "level": log_level,
-                "propagate": False
+                "propagate": True
             },
             
-            # Third-party loggers (less verbose)
+            # Third-party loggers (less verbose). dictConfig drops any
+            # handlers these loggers already had (uvicorn configures its own
+            # before the app is imported), so they must propagate to root
             "httpx": {
-                "handlers": ["console"],
                 "level": "WARNING",
-                "propagate": False
+                "propagate": True
             },
             "tortoise": {
-                "handlers": ["console"],
                 "level": "WARNING",
-                "propagate": False
+                "propagate": True
             },
             "uvicorn": {
-                "handlers": ["console"],
-                "level": "INFO",
-                "propagate": False
-            },
-            "uvicorn.access": {
-                "handlers": ["console"],
                 "level": "INFO",
-                "propagate": False
+                "propagate": True
             }
         },
         "root": {
-            "handlers": ["console"],
-            "level": log_level
+            "handlers": handlers,
+            "level": "WARNING"
         }
     }
     
-    # Create logs directory if it doesn't exist
-    os.makedirs("/app/logs", exist_ok=True)
+    if "file" not in handlers:
+        del config["handlers"]["file"]
     
     # Apply the configuration
     logging.config.dictConfig(config)
+    _CONFIGURED = True
     
     # Set service-wide context
     structlog.contextvars.clear_contextvars()
@@ -239,7 +210,7 @@ def setup_logging(
         log_level=log_level,
         service_name=service_name,
         environment=environment,
-        handlers=["console", "file"]
+        handlers=handlers
     )
 
 @contextmanager
@@ -261,43 +232,126 @@ def log_request_context(
         tenant_id: Optional tenant identifier
     """
     
-    # Store old context
-    old_request_id = getattr(request_context, 'request_id', None)
-    old_user_id = getattr(request_context, 'user_id', None)
-    old_tenant_id = getattr(request_context, 'tenant_id', None)
-    old_endpoint = getattr(request_context, 'endpoint', None)
+    # bound_contextvars restores the previous bindings on exit, so
+    # service-wide context set in setup_logging survives the request
+    with structlog.contextvars.bound_contextvars(
+        request_id=request_id,
+        endpoint=endpoint,
+        method=method,
+        user_id=user_id,
+        tenant_id=tenant_id
+    ):
+        yield
+
+# Metric, alert and monitoring event log calls are handed to a background
+# thread so the event loop does not pay for rendering and writing them. The
+# batcher is started from the application lifespan; without it (scripts,
+# tests) calls are logged inline.
+LOG_QUEUE_MAXSIZE = 10_000
+LOG_BATCH_SIZE = 256
+# Seconds to wait for the batcher thread at shutdown
+LOG_BATCHER_STOP_TIMEOUT = 5.0
+_LOG_BATCHER_STOP = object()
+_log_queue: Optional["queue.Queue[Any]"] = None
+_log_thread: Optional[threading.Thread] = None
+# Guards queueing against the batcher being stopped
+_log_lock = threading.Lock()
+
+def submit_log(method: Callable[..., Any], event: str, fields: Dict[str, Any]) -> None:
+    """
+    Queue a log call for the batcher, or log inline if it isn't running.
     
+    Args:
+        method: Bound log method to call, e.g. ``logger.info``
+        event: Event name
+        fields: Event fields
+    """
+    if _log_queue is not None:
+        # The batcher thread runs outside the request's context, so carry the
+        # bound request context along with the event
+        queued_fields = structlog.contextvars.get_contextvars()
+        queued_fields.update(fields)
+        # Under the lock, the batcher can't be detached between the check and
+        # the put, so nothing is queued after stop_log_batcher's final drain
+        with _log_lock:
+            if _log_queue is not None and _log_thread.is_alive():
+                try:
+                    _log_queue.put_nowait((method, event, queued_fields))
+                    return
+                except queue.Full:
+                    pass
+    method(event, **fields)
+
+def _write_log_entry(entry: Any) -> None:
+    """Make one queued log call, reporting failures to stderr."""
+    method, event, fields = entry
     try:
-        # Set new context
-        request_context.request_id = request_id
-        request_context.user_id = user_id
-        request_context.tenant_id = tenant_id
-        request_context.endpoint = f"{method} {endpoint}"
-        
-        # Bind context variables
-        structlog.contextvars.bind_contextvars(
-            request_id=request_id,
-            endpoint=endpoint,
-            method=method,
-            user_id=user_id,
-            tenant_id=tenant_id
-        )
-        
-        yield
-        
-    finally:
-        # Restore old context
-        request_context.request_id = old_request_id
-        request_context.user_id = old_user_id
-        request_context.tenant_id = old_tenant_id
-        request_context.endpoint = old_endpoint
-        
-        # Clear context variables
-        structlog.contextvars.clear_contextvars()
+        method(event, **fields)
+    except Exception as e:
+        # A bad record must not stop the batcher, but shouldn't vanish either
+        print(f"log batcher: failed to write {event!r}: {e!r}", file=sys.stderr)
+
+def _drain_log_queue(log_queue: "queue.Queue[Any]") -> None:
+    """Write queued log calls in batches of up to LOG_BATCH_SIZE until stopped."""
+    stopped = False
+    while not stopped:
+        batch = [log_queue.get()]
+        while len(batch) < LOG_BATCH_SIZE:
+            try:
+                batch.append(log_queue.get_nowait())
+            except queue.Empty:
+                break
+        for entry in batch:
+            if entry is _LOG_BATCHER_STOP:
+                # Finish the batch; anything queued later is written by
+                # stop_log_batcher
+                stopped = True
+                continue
+            _write_log_entry(entry)
+
+def start_log_batcher() -> None:
+    """Start the background log batcher thread."""
+    global _log_queue, _log_thread
+    if _log_thread is not None:
+        return
+    _log_queue = queue.Queue(maxsize=LOG_QUEUE_MAXSIZE)
+    _log_thread = threading.Thread(
+        target=_drain_log_queue,
+        args=(_log_queue,),
+        name="log-batcher",
+        daemon=True
+    )
+    _log_thread.start()
+
+async def stop_log_batcher() -> None:
+    """Stop the background log batcher once everything queued is written."""
+    global _log_queue, _log_thread
+    if _log_thread is None:
+        return
+    with _log_lock:
+        log_queue, thread = _log_queue, _log_thread
+        _log_queue = _log_thread = None
+    # The stop marker is queued after everything submitted so far. If the
+    # queue is full the join times out instead, and the rest is drained below
+    try:
+        log_queue.put_nowait(_LOG_BATCHER_STOP)
+    except queue.Full:
+        pass
+    await asyncio.to_thread(thread.join, LOG_BATCHER_STOP_TIMEOUT)
+    if thread.is_alive():
+        print("log batcher: did not stop in time, draining its queue inline", file=sys.stderr)
+    # Write whatever was queued after the stop marker or never reached
+    while True:
+        try:
+            entry = log_queue.get_nowait()
+        except queue.Empty:
+            break
+        if entry is not _LOG_BATCHER_STOP:
+            _write_log_entry(entry)
 
 def log_performance_metrics(
     operation: str,
-    duration_ms: float,
+    duration_us: int,
     success: bool = True,
     **kwargs
 ) -> None:
@@ -306,18 +360,17 @@ def log_performance_metrics(
     
     Args:
         operation: Name of the operation being measured
-        duration_ms: Duration in milliseconds
+        duration_us: Duration in integer microseconds
         success: Whether the operation was successful
         **kwargs: Additional metadata
     """
     
-    logger.info(
-        "performance_metric",
-        operation=operation,
-        duration_ms=round(duration_ms, 2),
-        success=success,
+    submit_log(logger.info, "performance_metric", {
+        "operation": operation,
+        "duration_us": duration_us,
+        "success": success,
         **kwargs
-    )
+    })
 
 def log_security_alert(
     alert_type: str,
@@ -337,14 +390,13 @@ def log_security_alert(
         tenant_id: Optional tenant identifier
     """
     
-    logger.warning(
-        "security_alert",
-        alert_type=alert_type,
-        severity=severity,
-        user_id=user_id,
-        tenant_id=tenant_id,
+    submit_log(logger.warning, "security_alert", {
+        "alert_type": alert_type,
+        "severity": severity,
+        "user_id": user_id,
+        "tenant_id": tenant_id,
         **details
-    )
+    })
 
 def log_business_event(
     event_type: str,
@@ -374,7 +426,7 @@ def log_api_metrics(
     endpoint: str,
     method: str,
     status_code: int,
-    duration_ms: float,
+    duration_us: int,
     user_id: Optional[str] = None,
     tenant_id: Optional[str] = None,
     **kwargs
@@ -386,22 +438,21 @@ def log_api_metrics(
         endpoint: API endpoint
         method: HTTP method
         status_code: Response status code
-        duration_ms: Request duration in milliseconds
+        duration_us: Request duration in integer microseconds
         user_id: Optional user identifier
         tenant_id: Optional tenant identifier
         **kwargs: Additional metadata
     """
     
-    logger.info(
-        "api_metric",
-        endpoint=endpoint,
-        method=method,
-        status_code=status_code,
-        duration_ms=round(duration_ms, 2),
-        user_id=user_id,
-        tenant_id=tenant_id,
+    submit_log(logger.info, "api_metric", {
+        "endpoint": endpoint,
+        "method": method,
+        "status_code": status_code,
+        "duration_us": duration_us,
+        "user_id": user_id,
+        "tenant_id": tenant_id,
         **kwargs
-    )
+    })
 
 # Convenience functions for common log levels
 def log_error(message: str, **kwargs) -> None:
@@ -5,7 +5,9 @@ This package contains custom middleware for the chatbot backend.
 """
 
 from .request_logging import RequestLoggingMiddleware
+from .fast_path import FastPathMiddleware
 
 __all__ = [
-    'RequestLoggingMiddleware'
+    'RequestLoggingMiddleware',
+    'FastPathMiddleware'
 ] 
\ No newline at end of file
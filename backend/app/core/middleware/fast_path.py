@@ -0,0 +1,64 @@
+"""
+Fast Path Middleware
+
+This middleware serves hot, context-free GET routes (liveness probes, the
+root endpoint) straight from the application's exception-handling layer,
+skipping the tenant and request logging middleware below it.
+"""
+
+from typing import Iterable, Optional
+from starlette.middleware.exceptions import ExceptionMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+class FastPathMiddleware:
+    """
+    Middleware that routes GET requests for a fixed set of paths past the
+    rest of the user middleware.
+    
+    Fast-path requests are handed to the ``ExceptionMiddleware`` the
+    application builds below its user middleware, so exception handlers and
+    the rest of the normal inner stack still apply. It should be the outermost
+    user middleware so the bypass happens before any other per-request work.
+    """
+    
+    def __init__(self, app: ASGIApp, fast_paths: Iterable[str]):
+        """
+        Initialize the middleware.
+        
+        Args:
+            app: The ASGI application
+            fast_paths: Paths whose GET requests skip the rest of the stack
+        """
+        self.app = app
+        self.fast_paths = frozenset(fast_paths)
+        # Inner stack the fast paths are sent to, looked up on first use
+        # since the middleware below this one is built after it
+        self._fast_app: Optional[ASGIApp] = None
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] == "http"
+            and scope["method"] == "GET"
+            and scope["path"] in self.fast_paths
+        ):
+            if self._fast_app is None:
+                self._fast_app = self._find_exception_layer()
+            await self._fast_app(scope, receive, send)
+            return
+        
+        await self.app(scope, receive, send)
+    
+    def _find_exception_layer(self) -> ASGIApp:
+        """
+        Find the application's ``ExceptionMiddleware`` below this middleware.
+        
+        Returns:
+            The exception-handling layer, or the next app if the chain cannot
+            be followed (the request then takes the normal route)
+        """
+        app = self.app
+        while app is not None:
+            if isinstance(app, ExceptionMiddleware):
+                return app
+            app = getattr(app, "app", None)
+        return self.app
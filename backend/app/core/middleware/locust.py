@@ -1,8 +1,12 @@
+import orjson
 
-from locust import HttpUser, task, between
+from locust import task, between
+from locust.contrib.fasthttp import FastHttpUser
 
-class ChatbotUser(HttpUser):
+class ChatbotUser(FastHttpUser):
     wait_time = between(1, 2)
+    network_timeout = 10.0
+    connection_timeout = 5.0
 
     def on_start(self):
         # Zamijeni ovo stvarnim JWT tokenom ako je poznat
@@ -12,21 +16,22 @@ class ChatbotUser(HttpUser):
             "Content-Type": "application/json",
             "X-Tenant-ID": "9c512999-f380-4863-83ab-b5a469ae9262"
         }
-
-    @task(3)
-    def send_prompt(self):
-        payload = {
+        # Payload je isti za svaki zahtjev pa ga serijaliziramo samo jednom
+        self._prompt_body = orjson.dumps({
             "message": "En ten tore, you are great",
             "chatbot_instance_id": "3793bebc-23d0-48a0-8950-40b2ab7a5949",
             "conversation_id": "d13bb920-2131-4f31-92f7-28334248ed21"
-        }
-        self.client.post("/api/v1/chat", json=payload, headers=self.headers)
+        })
+
+    @task(3)
+    def send_prompt(self):
+        self.client.post("/api/v1/chat", data=self._prompt_body, headers=self.headers)
 
     @task(1)
     def get_chat_history(self):
         conversation_id = "7eeb6999-8ae7-4a76-8c96-323048b2bd58"
         url = f"/api/v1/chat/history?conversation_id={conversation_id}"
-        self.client.get(url, headers=self.headers)    
+        self.client.get(url, headers=self.headers)
 
     @task(1)
     def get_health(self):
@@ -14,14 +14,12 @@ Features:
 
 import time
 import uuid
-from typing import Callable, Optional
-from starlette.middleware.base import BaseHTTPMiddleware
+from typing import Optional
 from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from fastapi import HTTPException
 import structlog
 from app.core.logging_config import (
-    log_request_context,
     log_api_metrics,
     log_security_alert,
     log_performance_metrics
@@ -29,12 +27,26 @@ from app.core.logging_config import (
 
 logger = structlog.get_logger(__name__)
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
+# Alert type and severity raised for suspicious response status codes
+_STATUS_ALERTS = {
+    401: ("AUTHENTICATION_FAILURE", "MEDIUM"),
+    403: ("AUTHORIZATION_FAILURE", "MEDIUM"),
+    429: ("RATE_LIMIT_EXCEEDED", "HIGH"),
+}
+
+# Methods that modify state and should not be called unauthenticated
+_WRITE_METHODS = frozenset(("POST", "PUT", "PATCH", "DELETE"))
+
+class RequestLoggingMiddleware:
     """
     Middleware for comprehensive request/response logging and metrics.
+    
+    Implemented as a plain ASGI middleware: the response status and size are
+    captured by wrapping ``send``, so no per-request task or memory stream is
+    needed as with ``BaseHTTPMiddleware``.
     """
     
-    def __init__(self, app, exclude_paths: Optional[list] = None):
+    def __init__(self, app: ASGIApp, exclude_paths: Optional[list] = None):
         """
         Initialize the middleware.
         
@@ -42,35 +54,45 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
             app: The ASGI application
             exclude_paths: List of paths to exclude from logging
         """
-        super().__init__(app)
-        self.exclude_paths = exclude_paths or [
+        self.app = app
+        self.exclude_paths = frozenset(exclude_paths or (
             "/docs",
             "/openapi.json",
             "/redoc",
             "/favicon.ico",
             "/api/v1/healthz"
-        ]
+        ))
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process the request and add comprehensive logging.
         
         Args:
-            request: The incoming HTTP request
-            call_next: The next middleware/endpoint in the chain
-            
-        Returns:
-            HTTP response
+            scope: The ASGI connection scope
+            receive: The ASGI receive channel
+            send: The ASGI send channel
         """
-        start_time = time.time()
-        request_id = str(uuid.uuid4())
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        path = scope["path"]
+        
+        # Skip logging for excluded paths before doing any per-request work
+        if path in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+        
+        request = Request(scope)
+        start_ns = time.perf_counter_ns()
+        request_id = uuid.uuid4().hex
         
         # Extract basic request information
         method = request.method
-        url = str(request.url)
-        path = request.url.path
-        query_params = dict(request.query_params)
-        headers = dict(request.headers)
+        # Only parse the query string when the request actually has one
+        query_params = dict(request.query_params) if scope.get("query_string") else None
+        # Read headers lazily from the scope rather than materializing a dict
+        headers = request.headers
         client_ip = self._get_client_ip(request)
         user_agent = headers.get("user-agent", "unknown")
         
@@ -78,88 +100,100 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         user_id = None
         tenant_id = headers.get("x-tenant-id")
         
-        # Skip logging for excluded paths
-        if path in self.exclude_paths:
-            response = await call_next(request)
-            return response
-        
-        # Add request ID to request state for use in other parts of the app
+        # Add request ID and client IP to request state for use in other parts
+        # of the app (the IP is read back by _check_security_alerts)
         request.state.request_id = request_id
+        request.state.client_ip = client_ip
+        
+        # Filled in from the http.response.start message
+        response_start: dict = {}
+        
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                response_start["status"] = message["status"]
+                for name, value in message.get("headers", ()):
+                    if name == b"content-length":
+                        response_start["content_length"] = value.decode("latin-1")
+                        break
+            await send(message)
         
-        response = None
         error = None
         
+        # Bind request context for all logs within this request, including the
+        # exception branches below; the tokens restore the previous bindings
+        context_tokens = structlog.contextvars.bind_contextvars(
+            request_id=request_id,
+            endpoint=path,
+            method=method,
+            user_id=user_id,
+            tenant_id=tenant_id
+        )
+        
         try:
-            # Use request context for all logs within this request
-            with log_request_context(
-                request_id=request_id,
+            # Log request start
+            logger.info(
+                "request_started",
+                method=method,
+                path=path,
+                query_params=query_params,
+                client_ip=client_ip,
+                user_agent=user_agent,
+                content_length=headers.get("content-length"),
+                content_type=headers.get("content-type")
+            )
+            
+            # Process the request
+            await self.app(scope, receive, send_wrapper)
+            
+            # Calculate processing time
+            duration_us = (time.perf_counter_ns() - start_ns) // 1000
+            processing_time = duration_us / 1000
+            
+            # Extract response information
+            status_code = response_start.get("status", 500)
+            content_length = response_start.get("content_length", 0)
+            
+            # Log successful request completion
+            logger.info(
+                "request_completed",
+                status_code=status_code,
+                processing_time_ms=round(processing_time, 2),
+                response_size=content_length
+            )
+            
+            # Log API metrics
+            log_api_metrics(
                 endpoint=path,
                 method=method,
+                status_code=status_code,
+                duration_us=duration_us,
                 user_id=user_id,
-                tenant_id=tenant_id
-            ):
-                # Log request start
-                logger.info(
-                    "request_started",
-                    method=method,
-                    path=path,
-                    query_params=query_params if query_params else None,
-                    client_ip=client_ip,
-                    user_agent=user_agent,
-                    content_length=headers.get("content-length"),
-                    content_type=headers.get("content-type")
-                )
-                
-                # Process the request
-                response = await call_next(request)
-                
-                # Calculate processing time
-                processing_time = (time.time() - start_time) * 1000
-                
-                # Extract response information
-                status_code = response.status_code
-                content_length = response.headers.get("content-length", 0)
-                
-                # Log successful request completion
-                logger.info(
-                    "request_completed",
-                    status_code=status_code,
-                    processing_time_ms=round(processing_time, 2),
-                    response_size=content_length
-                )
-                
-                # Log API metrics
-                log_api_metrics(
+                tenant_id=tenant_id,
+                client_ip=client_ip,
+                user_agent=user_agent
+            )
+            
+            # Log performance metrics for slow requests
+            if processing_time > 1000:  # Requests taking more than 1 second
+                log_performance_metrics(
+                    operation="slow_request",
+                    duration_us=duration_us,
+                    success=status_code < 400,
                     endpoint=path,
                     method=method,
-                    status_code=status_code,
-                    duration_ms=processing_time,
-                    user_id=user_id,
-                    tenant_id=tenant_id,
-                    client_ip=client_ip,
-                    user_agent=user_agent
+                    status_code=status_code
                 )
-                
-                # Log performance metrics for slow requests
-                if processing_time > 1000:  # Requests taking more than 1 second
-                    log_performance_metrics(
-                        operation="slow_request",
-                        duration_ms=processing_time,
-                        success=status_code < 400,
-                        endpoint=path,
-                        method=method,
-                        status_code=status_code
-                    )
-                
-                # Check for potential security issues
-                await self._check_security_alerts(
-                    request, response, processing_time, user_id, tenant_id
-                )
-                
+            
+            # Check for potential security issues
+            await self._check_security_alerts(
+                request, status_code, processing_time, user_id, tenant_id
+            )
+            
         except HTTPException as e:
             error = e
             status_code = e.status_code
-            processing_time = (time.time() - start_time) * 1000
+            duration_us = (time.perf_counter_ns() - start_ns) // 1000
+            processing_time = duration_us / 1000
             
             logger.warning(
                 "request_http_exception",
@@ -173,7 +207,7 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
                 endpoint=path,
                 method=method,
                 status_code=status_code,
-                duration_ms=processing_time,
+                duration_us=duration_us,
                 user_id=user_id,
                 tenant_id=tenant_id,
                 error_type="HTTPException",
@@ -185,12 +219,15 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         except Exception as e:
             error = e
             status_code = 500
-            processing_time = (time.time() - start_time) * 1000
+            error_type = type(e).__name__
+            error_detail = str(e)
+            duration_us = (time.perf_counter_ns() - start_ns) // 1000
+            processing_time = duration_us / 1000
             
             logger.error(
                 "request_unhandled_exception",
-                error=str(e),
-                error_type=type(e).__name__,
+                error=error_detail,
+                error_type=error_type,
                 processing_time_ms=round(processing_time, 2)
             )
             
@@ -199,11 +236,11 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
                 endpoint=path,
                 method=method,
                 status_code=status_code,
-                duration_ms=processing_time,
+                duration_us=duration_us,
                 user_id=user_id,
                 tenant_id=tenant_id,
-                error_type=type(e).__name__,
-                error_detail=str(e)
+                error_type=error_type,
+                error_detail=error_detail
             )
             
             # Log security alert for unexpected errors
@@ -213,8 +250,8 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
                 details={
                     "endpoint": path,
                     "method": method,
-                    "error": str(e),
-                    "error_type": type(e).__name__
+                    "error": error_detail,
+                    "error_type": error_type
                 },
                 user_id=user_id,
                 tenant_id=tenant_id
@@ -222,7 +259,8 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
             
             raise e
         
-        return response
+        finally:
+            structlog.contextvars.reset_contextvars(**context_tokens)
     
     def _get_client_ip(self, request: Request) -> str:
         """
@@ -253,7 +291,7 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
     async def _check_security_alerts(
         self,
         request: Request,
-        response: Response,
+        status_code: int,
         processing_time: float,
         user_id: Optional[str],
         tenant_id: Optional[str]
@@ -263,61 +301,36 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         
         Args:
             request: The HTTP request
-            response: The HTTP response
+            status_code: The HTTP response status code
             processing_time: Request processing time in milliseconds
             user_id: Optional user identifier
             tenant_id: Optional tenant identifier
         """
-        path = request.url.path
+        path = request.scope["path"]
         method = request.method
-        status_code = response.status_code
-        client_ip = self._get_client_ip(request)
-        
-        # Check for authentication failures
-        if status_code == 401:
-            log_security_alert(
-                alert_type="AUTHENTICATION_FAILURE",
-                severity="MEDIUM",
-                details={
-                    "endpoint": path,
-                    "method": method,
-                    "client_ip": client_ip,
-                    "user_agent": request.headers.get("user-agent")
-                },
-                user_id=user_id,
-                tenant_id=tenant_id
-            )
-        
-        # Check for authorization failures
-        elif status_code == 403:
-            log_security_alert(
-                alert_type="AUTHORIZATION_FAILURE",
-                severity="MEDIUM",
-                details={
-                    "endpoint": path,
-                    "method": method,
-                    "client_ip": client_ip
-                },
-                user_id=user_id,
-                tenant_id=tenant_id
-            )
+        client_ip = request.state.client_ip
         
-        # Check for potential brute force attacks (multiple 401s from same IP)
-        elif status_code == 429:
+        # Check for authentication, authorization and rate limit failures
+        status_alert = _STATUS_ALERTS.get(status_code)
+        if status_alert:
+            alert_type, severity = status_alert
+            details = {
+                "endpoint": path,
+                "method": method,
+                "client_ip": client_ip
+            }
+            if status_code == 401:
+                details["user_agent"] = request.headers.get("user-agent")
             log_security_alert(
-                alert_type="RATE_LIMIT_EXCEEDED",
-                severity="HIGH",
-                details={
-                    "endpoint": path,
-                    "method": method,
-                    "client_ip": client_ip
-                },
+                alert_type=alert_type,
+                severity=severity,
+                details=details,
                 user_id=user_id,
                 tenant_id=tenant_id
             )
         
         # Check for suspicious request patterns
-        if method in ["POST", "PUT", "PATCH", "DELETE"] and not user_id:
+        if method in _WRITE_METHODS and not user_id:
             log_security_alert(
                 alert_type="UNAUTHENTICATED_WRITE_ATTEMPT",
                 severity="MEDIUM",
@@ -6,17 +6,64 @@ Enhanced for Promtail + Loki + Grafana observability stack.
 """
 
 import logging
-from typing import Any, Dict, Optional, Union
+from typing import Any, Callable, Dict, Optional, Union
 from uuid import UUID
 import structlog
-from datetime import datetime
 import time
 from enum import Enum
 from contextlib import contextmanager
+from functools import lru_cache
+from app.core.logging_config import submit_log
 
 # Configure logger for this module
 logger = structlog.get_logger(__name__)
 
+@lru_cache(maxsize=None)
+def _event_logger():
+    """
+    Resolve the module logger once and reuse it for the per-event helpers.
+    
+    ``logger`` is a lazy proxy that rebuilds a bound logger on every call.
+    Resolution is deferred to the first event, which happens after
+    ``setup_logging`` has configured structlog.
+    """
+    return logger.bind()
+
+# Severity names accepted by the event helpers, mapped to logging levels
+_SEVERITY_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+@lru_cache(maxsize=4096)
+def _uuid_str(value: UUID) -> str:
+    """Stringify a UUID, caching the result for IDs that recur across events."""
+    return str(value)
+
+def _is_enabled(level: int) -> bool:
+    """Check whether an event at ``level`` would be emitted at all."""
+    return _event_logger().is_enabled_for(level)
+
+@lru_cache(maxsize=None)
+def _log_methods() -> Dict[str, Callable[..., Any]]:
+    """Map each severity name to the matching method of the event logger."""
+    event_logger = _event_logger()
+    return {
+        "DEBUG": event_logger.debug,
+        "INFO": event_logger.info,
+        "WARNING": event_logger.warning,
+        "ERROR": event_logger.error,
+        "CRITICAL": event_logger.critical,
+    }
+
+def _emit(severity: str, event: str, event_data: Dict[str, Any]) -> None:
+    """Hand an event to the log batcher at the given severity (INFO if unknown)."""
+    methods = _log_methods()
+    submit_log(methods.get(severity, methods["INFO"]), event, event_data)
+
 class EventSeverity(str, Enum):
     """Event severity levels for consistent logging."""
     DEBUG = "DEBUG"
@@ -50,7 +97,7 @@ class EventType(str, Enum):
     CONVERSATION_STARTED = "conversation_started"
     BOT_INSTANCE_CREATED = "bot_instance_created"
 
-async def log_chat_event(
+def log_chat_event(
     event_type: str,
     user_id: Optional[Union[UUID, str]] = None,
     tenant_id: Optional[Union[UUID, str]] = None,
@@ -63,7 +110,7 @@ async def log_chat_event(
     processing_time_ms: Optional[float] = None,
     message_type: Optional[str] = None,  # For backward compatibility
     severity: str = "INFO",
-    **additional_data: Any
+    extra: Optional[Dict[str, Any]] = None
 ) -> None:
     """
     Log a chat-related event with structured data.
@@ -81,53 +128,43 @@ async def log_chat_event(
         processing_time_ms: Optional processing time in milliseconds
         message_type: Optional message type (for backward compatibility)
         severity: Event severity level
-        additional_data: Any additional data to log
+        extra: Optional additional data to log
     """
+    # Skip building the event entirely when its level is filtered out
+    if not _is_enabled(_SEVERITY_LEVELS.get(severity, logging.INFO)):
+        return
+    
     event_data = {
         "event_category": "chat",
         "event_type": event_type,
         "severity": severity,
-        "timestamp": datetime.utcnow().isoformat() + "Z",
     }
     
-    # Add IDs if provided
-    if user_id:
-        event_data["user_id"] = str(user_id)
-    if tenant_id:
-        event_data["tenant_id"] = str(tenant_id)
-    if conversation_id:
-        event_data["conversation_id"] = str(conversation_id)
-    if message_id:
-        event_data["message_id"] = str(message_id)
-    if chatbot_instance_id:
-        event_data["chatbot_instance_id"] = str(chatbot_instance_id)
-    
-    # Add optional fields
-    if error_message:
-        event_data["error_message"] = error_message
-    if error_type:
-        event_data["error_type"] = error_type
-    if model_type:
-        event_data["model_type"] = model_type
+    # Add IDs and optional fields in a single pass, skipping empty values
+    for key, value in (
+        ("user_id", user_id),
+        ("tenant_id", tenant_id),
+        ("conversation_id", conversation_id),
+        ("message_id", message_id),
+        ("chatbot_instance_id", chatbot_instance_id),
+        ("error_message", error_message),
+        ("error_type", error_type),
+        ("model_type", model_type),
+        ("message_type", message_type),
+    ):
+        if value:
+            event_data[key] = _uuid_str(value) if isinstance(value, UUID) else str(value)
     if processing_time_ms is not None:
         event_data["processing_time_ms"] = round(processing_time_ms, 2)
-    if message_type:
-        event_data["message_type"] = message_type
     
     # Add additional data
-    event_data.update(additional_data)
+    if extra:
+        event_data.update(extra)
     
     # Log based on severity
-    if severity == "ERROR":
-        logger.error("chat_event", **event_data)
-    elif severity == "WARNING":
-        logger.warning("chat_event", **event_data)
-    elif severity == "CRITICAL":
-        logger.critical("chat_event", **event_data)
-    else:
-        logger.info("chat_event", **event_data)
+    _emit(severity, "chat_event", event_data)
 
-async def log_security_event(
+def log_security_event(
     event_type: str,
     tenant_id: Optional[str] = None,
     user_id: Optional[str] = None,
@@ -148,31 +185,28 @@ async def log_security_event(
         alert_level: Security alert level (LOW, MEDIUM, HIGH, CRITICAL)
         **kwargs: Additional keyword arguments to be included in the event data
     """
+    if not _is_enabled(_SEVERITY_LEVELS.get(severity, logging.INFO)):
+        return
+    
     event_data = {
         "event_category": "security",
         "event_type": event_type,
         "severity": severity,
-        "timestamp": datetime.utcnow().isoformat() + "Z",
-        "tenant_id": tenant_id,
-        "user_id": user_id,
-        **(details or {}),
-        **kwargs  # Include any additional kwargs in the event data
+        "tenant_id": _uuid_str(tenant_id) if isinstance(tenant_id, UUID) else tenant_id,
+        "user_id": _uuid_str(user_id) if isinstance(user_id, UUID) else user_id,
     }
+    if details:
+        event_data.update(details)
+    # Include any additional kwargs in the event data
+    event_data.update(kwargs)
     
     if alert_level:
         event_data["alert_level"] = alert_level
     
     # Log based on severity
-    if severity == "ERROR":
-        logger.error("security_event", **event_data)
-    elif severity == "WARNING":
-        logger.warning("security_event", **event_data)
-    elif severity == "CRITICAL":
-        logger.critical("security_event", **event_data)
-    else:
-        logger.info("security_event", **event_data)
+    _emit(severity, "security_event", event_data)
 
-async def log_api_event(
+def log_api_event(
     endpoint: str,
     method: str,
     status_code: int,
@@ -199,6 +233,11 @@ async def log_api_event(
         user_agent: User agent string
         **kwargs: Additional data to log
     """
+    # Determine severity based on status code
+    severity = "ERROR" if status_code >= 500 else "WARNING" if status_code >= 400 else "INFO"
+    if not _is_enabled(_SEVERITY_LEVELS[severity]):
+        return
+    
     event_data = {
         "event_category": "api",
         "event_type": "api_request",
@@ -207,7 +246,6 @@ async def log_api_event(
         "status_code": status_code,
         "tenant_id": tenant_id,
         "user_id": user_id,
-        "timestamp": datetime.utcnow().isoformat() + "Z",
         **kwargs
     }
     
@@ -220,15 +258,9 @@ async def log_api_event(
     if user_agent:
         event_data["user_agent"] = user_agent
     
-    # Determine severity based on status code
-    if status_code >= 500:
-        logger.error("api_event", **event_data)
-    elif status_code >= 400:
-        logger.warning("api_event", **event_data)
-    else:
-        logger.info("api_event", **event_data)
+    _emit(severity, "api_event", event_data)
 
-async def log_performance_event(
+def log_performance_event(
     operation: str,
     duration_ms: float,
     success: bool = True,
@@ -247,6 +279,11 @@ async def log_performance_event(
         tenant_id: Optional tenant identifier
         **metadata: Additional metadata about the operation
     """
+    # Log as warning if operation is slow or failed (5 seconds threshold)
+    severity = "WARNING" if not success or duration_ms > 5000 else "INFO"
+    if not _is_enabled(_SEVERITY_LEVELS[severity]):
+        return
+    
     event_data = {
         "event_category": "performance",
         "event_type": "operation_completed",
@@ -255,17 +292,12 @@ async def log_performance_event(
         "success": success,
         "user_id": user_id,
         "tenant_id": tenant_id,
-        "timestamp": datetime.utcnow().isoformat() + "Z",
         **metadata
     }
     
-    # Log as warning if operation is slow or failed
-    if not success or duration_ms > 5000:  # 5 seconds threshold
-        logger.warning("performance_event", **event_data)
-    else:
-        logger.info("performance_event", **event_data)
+    _emit(severity, "performance_event", event_data)
 
-async def log_business_event(
+def log_business_event(
     event_type: str,
     user_id: Optional[str] = None,
     tenant_id: Optional[str] = None,
@@ -280,16 +312,18 @@ async def log_business_event(
         tenant_id: Optional tenant identifier
         **details: Additional event details
     """
+    if not _is_enabled(logging.INFO):
+        return
+    
     event_data = {
         "event_category": "business",
         "event_type": event_type,
         "user_id": user_id,
         "tenant_id": tenant_id,
-        "timestamp": datetime.utcnow().isoformat() + "Z",
         **details
     }
     
-    logger.info("business_event", **event_data)
+    _emit("INFO", "business_event", event_data)
 
 @contextmanager
 def log_operation_time(
@@ -307,7 +341,7 @@ def log_operation_time(
         tenant_id: Optional tenant identifier
         **metadata: Additional metadata about the operation
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
     success = True
     error = None
     
@@ -318,43 +352,17 @@ def log_operation_time(
         error = str(e)
         raise
     finally:
-        duration_ms = (time.time() - start_time) * 1000
+        duration_ms = (time.perf_counter() - start_time) * 1000
         
-        # Create a task to log the performance event
-        import asyncio
-        try:
-            loop = asyncio.get_running_loop()
-            loop.create_task(
-                log_performance_event(
-                    operation=operation,
-                    duration_ms=duration_ms,
-                    success=success,
-                    user_id=user_id,
-                    tenant_id=tenant_id,
-                    error=error,
-                    **metadata
-                )
-            )
-        except RuntimeError:
-            # No event loop running, log synchronously
-            event_data = {
-                "event_category": "performance",
-                "event_type": "operation_completed",
-                "operation": operation,
-                "duration_ms": round(duration_ms, 2),
-                "success": success,
-                "user_id": user_id,
-                "tenant_id": tenant_id,
-                "timestamp": datetime.utcnow().isoformat() + "Z",
-                **metadata
-            }
-            if error:
-                event_data["error"] = error
-            
-            if not success or duration_ms > 5000:
-                logger.warning("performance_event", **event_data)
-            else:
-                logger.info("performance_event", **event_data)
+        log_performance_event(
+            operation=operation,
+            duration_ms=duration_ms,
+            success=success,
+            user_id=user_id,
+            tenant_id=tenant_id,
+            error=error,
+            **metadata
+        )
 
 def log_metric(
     metric_name: str,
@@ -371,17 +379,19 @@ def log_metric(
         labels: Optional labels for the metric
         **metadata: Additional metadata
     """
+    if not _is_enabled(logging.INFO):
+        return
+    
     event_data = {
         "event_category": "metric",
         "event_type": "custom_metric",
         "metric_name": metric_name,
         "metric_value": value,
-        "timestamp": datetime.utcnow().isoformat() + "Z",
         "labels": labels or {},
         **metadata
     }
     
-    logger.info("metric_event", **event_data)
+    _emit("INFO", "metric_event", event_data)
 
 # Prometheus metrics helpers (if you want to add Prometheus support later)
 def increment_counter(metric_name: str, labels: Optional[Dict[str, str]] = None) -> None:
@@ -401,6 +411,5 @@ logger.info(
     "monitoring_module_initialized",
     event_category="system",
     event_type="module_init",
-    module="monitoring",
-    timestamp=datetime.utcnow().isoformat() + "Z"
+    module="monitoring"
 ) 
\ No newline at end of file
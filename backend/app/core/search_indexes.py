@@ -0,0 +1,44 @@
+"""
+Search Indexes
+
+One-off management command creating the trigram indexes that back the
+repositories' icontains searches. It is run once per deployment, not at app
+startup, because the pg_trgm extension needs elevated privileges and
+``CREATE INDEX CONCURRENTLY`` on a large table can take a long time:
+
+    python -m app.core.search_indexes
+"""
+
+import asyncio
+from tortoise import Tortoise
+from app.core.database import initialize_database, close_database_connection
+
+# Tortoise renders icontains as UPPER(CAST(col AS VARCHAR)) LIKE UPPER(...), so
+# the indexes are built on that exact expression. CONCURRENTLY must run
+# outside a transaction, hence one statement per entry.
+SEARCH_INDEXES_SQL = (
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    'CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_conversations_title_trgm '
+    'ON "conversations" USING GIN (UPPER(CAST("title" AS VARCHAR)) gin_trgm_ops)',
+    'CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_users_username_trgm '
+    'ON "users" USING GIN (UPPER(CAST("username" AS VARCHAR)) gin_trgm_ops)',
+    'CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_users_email_trgm '
+    'ON "users" USING GIN (UPPER(CAST("email" AS VARCHAR)) gin_trgm_ops)',
+)
+
+async def create_search_indexes() -> None:
+    """Create the indexes backing substring search, if they don't exist yet."""
+    connection = Tortoise.get_connection("default")
+    for statement in SEARCH_INDEXES_SQL:
+        await connection.execute_script(statement)
+
+async def main() -> None:
+    """Connect to the configured database and create the search indexes."""
+    await initialize_database()
+    try:
+        await create_search_indexes()
+    finally:
+        await close_database_connection()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -6,38 +6,35 @@ security-related error handling.
 """
 
 from fastapi import HTTPException, status
-import asyncio
 from ..monitoring import log_security_event
 
 class SecurityException(HTTPException):
-    """Base class for security-related exceptions."""
+    """
+    Base class for security-related exceptions.
+    
+    Subclasses set the HTTP status code as the ``status_code`` class attribute.
+    """
+    
+    status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
     
-    def __init__(self, status_code: int, detail: str):
+    def __init__(self, detail: str):
         """
         Initialize the exception.
         
         Args:
-            status_code: HTTP status code
             detail: Detailed error message
         """
+        status_code = type(self).status_code
         super().__init__(status_code=status_code, detail=detail)
         
-        # Create a new event loop for async logging if one doesn't exist
-        try:
-            loop = asyncio.get_running_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        
-        # Log security event
-        loop.create_task(
-            log_security_event(
-                event_type="security_exception",
-                error_type=self.__class__.__name__,
-                error_message=detail,
-                status_code=status_code,
-                severity="ERROR"
-            )
+        # Log security event (synchronous, so exceptions raised outside the
+        # event loop, e.g. in the threadpool, are logged too)
+        log_security_event(
+            event_type="security_exception",
+            error_type=self.__class__.__name__,
+            error_message=detail,
+            status_code=status_code,
+            severity="ERROR"
         )
 
 class TenantMismatchError(SecurityException):
@@ -45,116 +42,47 @@ class TenantMismatchError(SecurityException):
     Raised when a resource is accessed by a user from a different tenant.
     """
     
-    def __init__(self, detail: str):
-        """
-        Initialize the exception.
-        
-        Args:
-            detail: Detailed error message
-        """
-        super().__init__(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail=detail
-        )
+    status_code = status.HTTP_403_FORBIDDEN
 
 class AIServiceError(SecurityException):
     """
     Raised when there is an error communicating with the AI service.
     """
     
-    def __init__(self, detail: str):
-        """
-        Initialize the exception.
-        
-        Args:
-            detail: Detailed error message
-        """
-        super().__init__(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=detail
-        )
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
 
 class ValidationError(SecurityException):
     """
     Raised when input validation fails.
     """
     
-    def __init__(self, detail: str):
-        """
-        Initialize the exception.
-        
-        Args:
-            detail: Detailed error message
-        """
-        super().__init__(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=detail
-        )
+    status_code = status.HTTP_400_BAD_REQUEST
 
 class ResourceNotFoundError(SecurityException):
     """
     Raised when a requested resource is not found.
     """
     
-    def __init__(self, detail: str):
-        """
-        Initialize the exception.
-        
-        Args:
-            detail: Detailed error message
-        """
-        super().__init__(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=detail
-        )
+    status_code = status.HTTP_404_NOT_FOUND
 
 class AuthenticationError(SecurityException):
     """
     Raised when authentication fails.
     """
     
-    def __init__(self, detail: str):
-        """
-        Initialize the exception.
-        
-        Args:
-            detail: Detailed error message
-        """
-        super().__init__(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=detail
-        )
+    status_code = status.HTTP_401_UNAUTHORIZED
 
 class AuthorizationError(SecurityException):
     """
     Raised when a user is not authorized to perform an action.
     """
     
-    def __init__(self, detail: str):
-        """
-        Initialize the exception.
-        
-        Args:
-            detail: Detailed error message
-        """
-        super().__init__(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail=detail
-        )
+    status_code = status.HTTP_403_FORBIDDEN
 
 class RateLimitError(SecurityException):
     """
     Raised when rate limits are exceeded.
     """
     
-    def __init__(self, detail: str):
-        """
-        Initialize the exception.
-        
-        Args:
-            detail: Detailed error message
-        """
-        super().__init__(
-            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            detail=detail
-        ) 
\ No newline at end of file
+    status_code = status.HTTP_429_TOO_MANY_REQUESTS
+
@@ -5,12 +5,80 @@ This module provides functionality for detecting and masking personally identifi
 information (PII) in text using both regex patterns and NLP-based approaches.
 """
 
+import asyncio
+import multiprocessing
 import re
-from typing import Dict, List, Set, Optional
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
 import spacy
 from pydantic import BaseModel
 from ..monitoring import log_security_event
 
+# Pipeline components entity recognition does not need
+_NER_DISABLED_PIPES = ["tagger", "parser", "lemmatizer", "attribute_ruler"]
+
+# Cheap prefilters: every regex pattern needs an "@" or a digit, and entities
+# worth masking are capitalized words or contain digits (money, dates)
+_REGEX_PII_TRIGGER = re.compile(r"[@\d]")
+_PII_TRIGGER = re.compile(r"[@\d]|[A-Z][a-z]")
+
+# Shortest text any regex pattern can match (e.g. "a@b.hr")
+_MIN_PII_LENGTH = 6
+
+# spaCy model of the NER worker process, loaded once by _init_ner_worker
+_ner_nlp = None
+
+# Shared NER worker pool, created on first use
+_ner_pool: Optional[ProcessPoolExecutor] = None
+
+def _load_ner_model():
+    """Load the spaCy model with only the components NER needs."""
+    try:
+        return spacy.load("en_core_web_sm", disable=_NER_DISABLED_PIPES)
+    except OSError:
+        # If model not found, download it
+        import subprocess
+        subprocess.run(["python", "-m", "spacy", "download", "en_core_web_sm"])
+        return spacy.load("en_core_web_sm", disable=_NER_DISABLED_PIPES)
+
+def _init_ner_worker() -> None:
+    """Load the spaCy model once per NER worker process."""
+    global _ner_nlp
+    _ner_nlp = _load_ner_model()
+
+def _batch_ner(texts: List[str]) -> List[List[Tuple[int, int, str, str]]]:
+    """
+    Run NER over a batch of texts inside the worker process.
+    
+    Returns:
+        For each text, its entities as (start, end, label, text) tuples
+    """
+    return [
+        [(ent.start_char, ent.end_char, ent.label_, ent.text) for ent in doc.ents]
+        for doc in _ner_nlp.pipe(texts, batch_size=32)
+    ]
+
+def _get_ner_pool() -> ProcessPoolExecutor:
+    """Get the shared NER worker pool, starting it on first use."""
+    global _ner_pool
+    if _ner_pool is None:
+        # Spawn rather than fork: the parent runs the event loop and the log
+        # batcher thread, neither of which is safe to fork
+        _ner_pool = ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_ner_worker
+        )
+    return _ner_pool
+
+def shutdown_ner_pool() -> None:
+    """Stop the shared NER worker pool if it was started."""
+    global _ner_pool
+    if _ner_pool is not None:
+        _ner_pool.shutdown(wait=False, cancel_futures=True)
+        _ner_pool = None
+
 class PIIPattern(BaseModel):
     """Configuration for a PII pattern"""
     name: str
@@ -24,16 +92,12 @@ class PIIDetector:
     """
     
     def __init__(self):
-        """Initialize the PII detector with common patterns and NLP model."""
-        # Load spaCy model for NER
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-        except OSError:
-            # If model not found, download it
-            import subprocess
-            subprocess.run(["python", "-m", "spacy", "download", "en_core_web_sm"])
-            self.nlp = spacy.load("en_core_web_sm")
-            
+        """
+        Initialize the PII detector with common patterns.
+        
+        The spaCy model is loaded by the shared NER worker process rather
+        than per detector.
+        """
         # Common PII patterns
         self.patterns = [
             PIIPattern(
@@ -68,6 +132,14 @@ class PIIDetector:
             )
         ]
         
+        # Each pattern is matched separately (a single alternation would let
+        # an earlier match hide an overlapping higher-priority one from
+        # DataMasker), but compiled once per detector
+        self._compiled_patterns = [
+            (re.compile(pattern.pattern), pattern)
+            for pattern in self.patterns
+        ]
+        
         # NER entity types to mask
         self.ner_types = {
             "PERSON": "[PERSON]",
@@ -77,7 +149,7 @@ class PIIDetector:
             "DATE": "[DATE]"
         }
 
-    async def detect_regex_pii(self, text: str) -> List[Dict]:
+    def detect_regex_pii(self, text: str) -> List[Dict]:
         """
         Detect PII using regex patterns.
         
@@ -88,8 +160,8 @@ class PIIDetector:
             List of dictionaries containing PII matches and their positions
         """
         matches = []
-        for pattern in self.patterns:
-            for match in re.finditer(pattern.pattern, text):
+        for regex, pattern in self._compiled_patterns:
+            for match in regex.finditer(text):
                 matches.append({
                     "start": match.start(),
                     "end": match.end(),
@@ -110,17 +182,20 @@ class PIIDetector:
         Returns:
             List of dictionaries containing PII matches and their positions
         """
-        doc = self.nlp(text)
-        matches = []
+        # spaCy inference holds the GIL for tens of milliseconds, so it runs
+        # in the worker process instead of on the event loop
+        loop = asyncio.get_running_loop()
+        (entities,) = await loop.run_in_executor(_get_ner_pool(), _batch_ner, [text])
         
-        for ent in doc.ents:
-            if ent.label_ in self.ner_types:
+        matches = []
+        for start, end, label, value in entities:
+            if label in self.ner_types:
                 matches.append({
-                    "start": ent.start_char,
-                    "end": ent.end_char,
-                    "value": ent.text,
-                    "type": ent.label_,
-                    "mask": self.ner_types[ent.label_],
+                    "start": start,
+                    "end": end,
+                    "value": value,
+                    "type": label,
+                    "mask": self.ner_types[label],
                     "priority": 1
                 })
         return matches
@@ -134,10 +209,13 @@ class DataMasker:
         """Initialize the data masker."""
         pass
 
-    async def mask_text(self, text: str, matches: List[Dict]) -> str:
+    def mask_text(self, text: str, matches: List[Dict]) -> str:
         """
         Mask PII in text based on detected matches.
         
+        Higher-priority matches are accepted first; a match overlapping an
+        already accepted one is skipped.
+        
         Args:
             text: Original text
             matches: List of PII matches with positions and mask values
@@ -145,31 +223,34 @@ class DataMasker:
         Returns:
             Text with PII masked
         """
-        # Sort matches by start position in reverse order
-        # This allows us to replace from end to start without affecting positions
-        matches.sort(key=lambda x: (-x["start"], -x["priority"]))
-        
-        # Create list from string for character-by-character replacement
-        chars = list(text)
+        # Accepted matches, kept sorted by start position alongside their
+        # starts so overlap checks are a bisect plus two integer compares
+        accepted: List[Dict] = []
+        starts: List[int] = []
         
-        # Track masked ranges to avoid double-masking
-        masked_ranges: Set[range] = set()
-        
-        for match in matches:
-            match_range = range(match["start"], match["end"])
+        for match in sorted(matches, key=lambda x: (-x["priority"], x["start"])):
+            start, end = match["start"], match["end"]
+            index = bisect_right(starts, start)
             
-            # Check if this range overlaps with any already masked range
-            overlap = any(
-                len(set(match_range).intersection(masked_range)) > 0
-                for masked_range in masked_ranges
-            )
+            # Overlaps the accepted match starting before it, or the next one
+            if index > 0 and accepted[index - 1]["end"] > start:
+                continue
+            if index < len(starts) and starts[index] < end:
+                continue
             
-            if not overlap:
-                # Replace characters with mask
-                chars[match["start"]:match["end"]] = list(match["mask"])
-                masked_ranges.add(match_range)
+            accepted.insert(index, match)
+            starts.insert(index, start)
         
-        return "".join(chars)
+        # Rebuild the text left to right from unmasked slices and masks
+        parts = []
+        position = 0
+        for match in accepted:
+            parts.append(text[position:match["start"]])
+            parts.append(match["mask"])
+            position = match["end"]
+        parts.append(text[position:])
+        
+        return "".join(parts)
 
 class PIIHandler:
     """
@@ -191,9 +272,18 @@ class PIIHandler:
         Returns:
             Text with PII masked
         """
+        # Most chat messages carry no PII; skip detection when nothing in the
+        # text could start a match
+        if len(text) < _MIN_PII_LENGTH or not _PII_TRIGGER.search(text):
+            return text
+        
         try:
             # Detect PII using both methods
-            regex_matches = await self.detector.detect_regex_pii(text)
+            regex_matches = (
+                self.detector.detect_regex_pii(text)
+                if _REGEX_PII_TRIGGER.search(text)
+                else []
+            )
             ner_matches = await self.detector.detect_ner_pii(text)
             
             # Combine all matches
@@ -201,19 +291,19 @@ class PIIHandler:
             
             # If PII was found, log the event (without the actual PII values)
             if all_matches:
-                await log_security_event(
+                log_security_event(
                     event_type="pii_detected",
                     pii_types=[match["type"] for match in all_matches],
                     count=len(all_matches)
                 )
             
             # Mask the text
-            masked_text = await self.masker.mask_text(text, all_matches)
+            masked_text = self.masker.mask_text(text, all_matches)
             
             return masked_text
             
         except Exception as e:
-            await log_security_event(
+            log_security_event(
                 event_type="pii_processing_error",
                 error_type=str(type(e).__name__),
                 error_message=str(e)
@@ -5,11 +5,13 @@ This module provides tenant context management and isolation for multi-tenant ap
 """
 
 from contextvars import ContextVar
+from functools import lru_cache
 from uuid import UUID
 from typing import Optional
 from fastapi import HTTPException, Depends
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 import logging
 import json
 from ..monitoring import log_security_event
@@ -29,6 +31,19 @@ def get_current_tenant() -> UUID:
             detail="Tenant context not set"
         )
 
+# Filters scoping a query to the current tenant's active rows, memoized per
+# tenant context so repositories do not rebuild them for every query
+_tenant_filters_context: ContextVar[dict] = ContextVar('tenant_filters')
+
+def get_tenant_filters() -> dict:
+    """Get the query filters for the current tenant's active rows."""
+    tenant_id = get_current_tenant()
+    filters = _tenant_filters_context.get(None)
+    if filters is None or filters["tenant_id"] is not tenant_id:
+        filters = {"tenant_id": tenant_id, "is_active": True}
+        _tenant_filters_context.set(filters)
+    return filters
+
 class TenantContextManager:
     """Context manager for handling tenant context."""
     
@@ -38,7 +53,7 @@ class TenantContextManager:
 
     async def __aenter__(self):
         self.token = tenant_context.set(self.tenant_id)
-        await log_security_event(
+        log_security_event(
             event_type="tenant_context_set",
             tenant_id=self.tenant_id
         )
@@ -47,76 +62,107 @@ class TenantContextManager:
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         tenant_context.reset(self.token)
         if exc_type:
-            await log_security_event(
+            log_security_event(
                 event_type="tenant_context_error",
                 tenant_id=self.tenant_id,
                 error_type=str(exc_type.__name__),
                 error_message=str(exc_val)
             )
 
-class TenantMiddleware(BaseHTTPMiddleware):
-    """Middleware to extract and set tenant context from request."""
+# Paths served without a tenant context
+_PUBLIC_PATHS = frozenset((
+    "/api/v1/healthz",
+    "/docs",
+    "/openapi.json",
+    "/redoc",
+    "/api/v1/tenant/info"  # Tenant discovery endpoint
+))
+
+@lru_cache(maxsize=1024)
+def _parse_tenant_id(tenant_id: str) -> UUID:
+    """Parse an X-Tenant-ID header value, caching the few active tenants."""
+    return UUID(tenant_id)
+
+class TenantMiddleware:
+    """
+    Middleware to extract and set tenant context from request.
+    
+    Implemented as a plain ASGI middleware so the tenant context is set in the
+    same task that runs the endpoint, without ``BaseHTTPMiddleware``'s extra
+    task and memory stream per request.
+    """
     
-    async def dispatch(self, request: Request, call_next):
-        # Log request details in a structured way
-        request_headers = dict(request.headers)
-        # Remove sensitive information from headers before logging
-        if 'authorization' in request_headers:
-            request_headers['authorization'] = '[REDACTED]'
-
-        logger.info("Processing request",
-                   extra={
-                       'request_path': str(request.url.path),
-                       'request_method': request.method,
-                       'headers': request_headers,
-                       'client_host': request.client.host if request.client else None
-                   })
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        path = scope["path"]
+        method = scope["method"]
+        client = scope.get("client")
+        
+        # Log request details in a structured way; the full header dump is
+        # only built when debug logging is on
+        request_details = {
+            'request_path': path,
+            'request_method': method,
+            'client_host': client[0] if client else None
+        }
+        if logger.isEnabledFor(logging.DEBUG):
+            request_headers = dict(Headers(scope=scope))
+            # Remove sensitive information from headers before logging
+            if 'authorization' in request_headers:
+                request_headers['authorization'] = '[REDACTED]'
+            request_details['headers'] = request_headers
+
+        logger.info("Processing request", extra=request_details)
 
         # Bypass tenant enforcement for public endpoints and tenant discovery endpoint
-        public_paths = [
-            "/api/v1/healthz", 
-            "/docs", 
-            "/openapi.json", 
-            "/redoc",
-            "/api/v1/tenant/info"  # Add tenant discovery endpoint to exemptions
-        ]
-        
-        if request.url.path in public_paths:
+        if path in _PUBLIC_PATHS:
             logger.debug("Bypassing tenant check for public path", 
-                        extra={'path': request.url.path})
-            return await call_next(request)
+                        extra={'path': path})
+            await self.app(scope, receive, send)
+            return
 
-        tenant_id = request.headers.get("X-Tenant-ID")
+        tenant_id = None
+        for name, value in scope["headers"]:
+            if name == b"x-tenant-id":
+                tenant_id = value.decode("latin-1")
+                break
 
         if not tenant_id:
             logger.warning("Missing tenant ID in request",
-                         extra={'path': request.url.path})
-            raise HTTPException(
-                status_code=400,
-                detail="X-Tenant-ID header is required"
-            )
+                         extra={'path': path})
+            await self._reject(scope, receive, send, "X-Tenant-ID header is required")
+            return
 
         try:
-            tenant_uuid = UUID(tenant_id)
-            await log_security_event(
+            tenant_uuid = _parse_tenant_id(tenant_id)
+            log_security_event(
                 event_type="tenant_request",
                 tenant_id=str(tenant_uuid),
                 details={
-                    "path": str(request.url.path),
-                    "method": request.method
+                    "path": path,
+                    "method": method
                 }
             )
         except ValueError:
             logger.error("Invalid tenant ID format",
                         extra={'tenant_id': tenant_id})
-            raise HTTPException(
-                status_code=400,
-                detail="Invalid tenant ID format"
-            )
+            await self._reject(scope, receive, send, "Invalid tenant ID format")
+            return
 
         async with TenantContextManager(tenant_uuid):
-            response = await call_next(request)
-            return response
+            await self.app(scope, receive, send)
+
+    @staticmethod
+    async def _reject(scope: Scope, receive: Receive, send: Send, detail: str) -> None:
+        """Send a 400 response shaped like FastAPI's HTTPException responses."""
+        response = JSONResponse({"detail": detail}, status_code=400)
+        await response(scope, receive, send)
 
 # Dependency for FastAPI routes
 async def require_tenant(tenant_id: str = Depends(get_current_tenant)) -> UUID:
@@ -1,27 +1,45 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from starlette.middleware import Middleware
 from fastapi.middleware.cors import CORSMiddleware
-from app.api.v1.chat import router as chat_router
 from app.api.v1.health import router as health_router
 from app.core.security.tenancy import TenantMiddleware
-from app.core.middleware import RequestLoggingMiddleware
+from app.core.security.pii import shutdown_ner_pool
+from app.services.ai import close_ai_clients
+from app.services.auth import close_auth_clients
+from app.core.middleware import RequestLoggingMiddleware, FastPathMiddleware
 from app.core.database import initialize_database, close_database_connection
-from app.core.logging_config import init_logging, log_info, log_error
+from app.core.logging_config import (
+    init_logging,
+    log_info,
+    log_error,
+    start_log_batcher,
+    stop_log_batcher
+)
 import logging
 import sys
 import os
 from contextlib import asynccontextmanager
+import anyio.to_thread
 from app.api.v1 import chat, tenant, bot
+import orjson
 import structlog
 
 # Initialize comprehensive logging
 init_logging()
 logger = structlog.get_logger(__name__)
 
+# Worker threads available to sync endpoints and offloaded blocking calls
+# such as bcrypt (AnyIO defaults to 40)
+THREADPOOL_SIZE = 100
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Startup and shutdown events with comprehensive logging"""
     # Startup
+    if tuple(app.user_middleware) != MIDDLEWARE:
+        raise RuntimeError("Middleware must be registered in MIDDLEWARE, not added at runtime")
+    start_log_batcher()
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
     log_info(
         "application_startup_initiated",
         app_name="Secure Chatbot API",
@@ -62,7 +80,36 @@ async def lifespan(app: FastAPI):
             error_type=type(e).__name__
         )
     
+    await close_ai_clients()
+    await close_auth_clients()
+    shutdown_ner_pool()
+    
     log_info("application_shutdown_completed")
+    await stop_log_batcher()
+
+# Middleware stack, outermost first. It is fixed at construction so Starlette
+# builds the stack once instead of rebuilding it on each add_middleware call;
+# the lifespan checks nothing was added afterwards.
+MIDDLEWARE = (
+    # Serve the liveness probe and root endpoint straight from the router;
+    # they need no tenant context, CORS headers or request logging
+    Middleware(FastPathMiddleware, fast_paths=["/api/v1/healthz", "/"]),
+    # Allow cross-origin requests from the frontend
+    Middleware(
+        CORSMiddleware,
+        allow_origins=["*"],  # Adjust for production
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    ),
+    # Register tenant context middleware
+    Middleware(TenantMiddleware),
+    # Request logging middleware (innermost)
+    Middleware(
+        RequestLoggingMiddleware,
+        exclude_paths=["/docs", "/openapi.json", "/redoc", "/favicon.ico", "/api/v1/healthz"]
+    ),
+)
 
 app = FastAPI(
     title="Secure Chatbot API",
@@ -71,42 +118,42 @@ app = FastAPI(
     redoc_url="/redoc",
     openapi_url="/openapi.json",
     lifespan=lifespan,
+    middleware=list(MIDDLEWARE),
 )
 
-# Add request logging middleware first (innermost)
-app.add_middleware(
-    RequestLoggingMiddleware,
-    exclude_paths=["/docs", "/openapi.json", "/redoc", "/favicon.ico", "/api/v1/healthz"]
-)
+# Include routers, most frequently hit first since routing scans them in order
+API_V1_ROUTERS = (health_router, chat.router, tenant.router, bot.router)
+for api_router in API_V1_ROUTERS:
+    app.include_router(api_router, prefix="/api/v1")
 
-# Register tenant context middleware
-app.add_middleware(TenantMiddleware)
-
-# Allow cross-origin requests from the frontend
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # Adjust for production
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-# Include routers
-app.include_router(chat_router, prefix="/api/v1")
-app.include_router(health_router, prefix="/api/v1")
-app.include_router(chat.router, prefix="/api/v1")
-app.include_router(tenant.router, prefix="/api/v1")
-app.include_router(bot.router, prefix="/api/v1")
+# The root response never changes, so it is serialized once
+_ROOT_BYTES = orjson.dumps({"message": "Secure Chatbot API is running."})
 
 @app.get("/", tags=["root"])
-def root():
+async def root():
     """Root endpoint with logging."""
     log_info(
         "root_endpoint_accessed",
         endpoint="/",
         method="GET"
     )
-    return {"message": "Secure Chatbot API is running."}
+    return Response(_ROOT_BYTES, media_type="application/json")
+
+def _check_duplicate_routes() -> None:
+    """Fail at startup if two API routers serve the same path and method."""
+    routes = [
+        ("/api/v1" + route.path, route.methods)
+        for api_router in API_V1_ROUTERS
+        for route in api_router.routes
+    ]
+    seen = set()
+    for path, methods in routes:
+        for method in methods or ():
+            if (path, method) in seen:
+                raise RuntimeError(f"Duplicate route registered: {method} {path}")
+            seen.add((path, method))
+
+_check_duplicate_routes()
 
 # Log application configuration on startup
 log_info(
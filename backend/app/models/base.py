@@ -1,7 +1,20 @@
 from tortoise import Model, fields
 from datetime import datetime
 from uuid import UUID, uuid4
-from typing import Optional
+from typing import Any, Optional
+import orjson
+
+
+def _orjson_dumps(value: Any) -> str:
+    """Encode a JSON field value with orjson."""
+    return orjson.dumps(value).decode()
+
+
+class OrjsonField(fields.JSONField):
+    """JSON field encoded and decoded with orjson instead of the stdlib json."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(encoder=_orjson_dumps, decoder=orjson.loads, **kwargs)
 
 
 class BaseModel(Model):
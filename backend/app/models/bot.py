@@ -1,5 +1,5 @@
 from tortoise import fields
-from datetime import datetime
+from datetime import datetime, timezone
 from app.models.base import TenantModel
 from app.models.user import User
 
@@ -24,5 +24,5 @@ class ChatbotInstance(TenantModel):
     async def publish(self) -> None:
         """Mark the chatbot instance as published."""
         self.is_published = True
-        self.published_at = datetime.utcnow()
+        self.published_at = datetime.now(timezone.utc)
         await self.save(update_fields=["is_published", "published_at"])
@@ -1,11 +1,11 @@
 from tortoise import fields
+from tortoise.transactions import in_transaction
 from typing import Optional, List
 from datetime import datetime
 from uuid import UUID
-from app.models.base import TenantModel
+from app.models.base import OrjsonField, TenantModel
 from app.models.user import User
 
-
 class Conversation(TenantModel):
     """Conversation model representing a chat session.
     
@@ -30,6 +30,8 @@ class Conversation(TenantModel):
     class Meta:
         table = "conversations"
         ordering = ["-last_message_at"]
+        # Serves a user's conversation listing in its default order
+        indexes = (("tenant_id", "user_id", "last_message_at"),)
 
     def __str__(self) -> str:
         return f"Conversation(title={self.title}, user={self.user_id}, bot={self.chatbot_instance_id})"
@@ -56,16 +58,22 @@ class Conversation(TenantModel):
         role: str,
         metadata: Optional[dict] = None
     ) -> "Message":
-        """Add a new message to the conversation."""
-        message = await Message.create(
-            conversation=self,
-            content=content,
-            role=role,
-            metadata=metadata,
-            tenant_id=self.tenant_id
-        )
+        """Add a new message to the conversation.
+        
+        The message insert and the ``last_message_at`` bump run in one
+        transaction, and the bump is a filtered UPDATE, so ``self`` is not
+        saved back or reloaded.
+        """
+        async with in_transaction():
+            message = await Message.create(
+                conversation=self,
+                content=content,
+                role=role,
+                metadata=metadata,
+                tenant_id=self.tenant_id
+            )
+            await Conversation.filter(id=self.id).update(last_message_at=message.timestamp)
         self.last_message_at = message.timestamp
-        await self.save(update_fields=["last_message_at"])
         return message
 
 
@@ -88,11 +96,14 @@ class Message(TenantModel):
     content = fields.TextField()
     role = fields.CharField(max_length=20)  # user, assistant, system
     timestamp = fields.DatetimeField(auto_now_add=True)
-    metadata = fields.JSONField(null=True)
+    metadata = OrjsonField(null=True)
 
     class Meta:
         table = "messages"
         ordering = ["timestamp"]
+        # Serves "latest messages of a conversation" lookups; PostgreSQL scans
+        # it backwards for ORDER BY timestamp DESC
+        indexes = (("tenant_id", "conversation_id", "timestamp"),)
 
     def __str__(self) -> str:
         return f"Message(role={self.role}, conversation={self.conversation_id})"
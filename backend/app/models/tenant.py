@@ -1,7 +1,7 @@
 from tortoise import fields
 from uuid import UUID
 from typing import Optional
-from app.models.base import BaseModel
+from app.models.base import BaseModel, OrjsonField
 
 class Tenant(BaseModel):
     """
@@ -17,7 +17,7 @@ class Tenant(BaseModel):
     """
     
     name = fields.CharField(max_length=255, null=True)
-    settings = fields.JSONField(default=dict)
+    settings = OrjsonField(default=dict)
     
     class Meta:
         table = "tenants"
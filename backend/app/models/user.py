@@ -1,10 +1,16 @@
 from tortoise import fields
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
-from passlib.hash import bcrypt
+import anyio
+import bcrypt
 from app.models.base import TenantModel
 
 
+def _bcrypt_secret(password: str) -> bytes:
+    """Encode a password for bcrypt, which only uses the first 72 bytes."""
+    return password.encode()[:72]
+
+
 class User(TenantModel):
     """User model for authentication and user management.
     
@@ -51,18 +57,26 @@ class User(TenantModel):
         """Get user by username."""
         return await cls.get_or_none(username=username, is_active=True)
 
-    def verify_password(self, password: str) -> bool:
-        """Verify if the provided password matches the hashed password."""
+    async def verify_password(self, password: str) -> bool:
+        """Verify if the provided password matches the hashed password.
+        
+        The bcrypt check runs in the worker thread pool so it does not block
+        the event loop.
+        """
         if not self.hashed_password:
             return False
-        return bcrypt.verify(password, self.hashed_password)
+        return await anyio.to_thread.run_sync(
+            bcrypt.checkpw,
+            _bcrypt_secret(password),
+            self.hashed_password.encode()
+        )
 
     @staticmethod
     def hash_password(password: str) -> str:
         """Hash a password using bcrypt."""
-        return bcrypt.hash(password)
+        return bcrypt.hashpw(_bcrypt_secret(password), bcrypt.gensalt(rounds=12)).decode()
 
     async def update_last_login(self) -> None:
         """Update the last login timestamp."""
-        self.last_login = datetime.utcnow()
+        self.last_login = datetime.now(timezone.utc)
         await self.save(update_fields=["last_login"]) 
\ No newline at end of file
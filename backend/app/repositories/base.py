@@ -1,8 +1,8 @@
 from typing import TypeVar, Generic, Type, Optional, List, Any, Dict
 from uuid import UUID
-from tortoise import Model
+from tortoise import Model, timezone
 from tortoise.expressions import Q
-from app.core.security.tenancy import get_current_tenant
+from app.core.security.tenancy import get_current_tenant, get_tenant_filters
 from app.models.base import TenantModel
 
 ModelType = TypeVar("ModelType", bound=Model)
@@ -10,8 +10,48 @@ ModelType = TypeVar("ModelType", bound=Model)
 class BaseRepository(Generic[ModelType]):
     """Base repository class with common CRUD operations."""
 
+    # Repositories only hold their model and precomputed SQL, so they carry
+    # no instance __dict__
+    __slots__ = ("model", "_get_by_id_sql")
+
+    # WHERE clause of the get_by_id lookup; $1 is the record ID
+    _GET_BY_ID_WHERE = "id = $1 AND is_active"
+
     def __init__(self, model: Type[ModelType]):
         self.model = model
+        self._get_by_id_sql: Optional[str] = None
+
+    def _build_get_by_id_sql(self) -> str:
+        """
+        Build the get_by_id query for the model.
+        
+        The lookup always has the same shape, so its SQL is built once instead
+        of going through Tortoise's query builder on every call. It is built on
+        first use because relation columns are only known after Tortoise.init.
+        """
+        return (
+            f'SELECT {self._column_list()} FROM "{self.model._meta.db_table}" '
+            f"WHERE {self._GET_BY_ID_WHERE} LIMIT 1"
+        )
+
+    def _column_list(self) -> str:
+        """Quoted, comma-separated list of the model's columns."""
+        return ", ".join(
+            f'"{column}"' for column in self.model._meta.fields_db_projection.values()
+        )
+
+    def _id_lookup_values(self, id: UUID) -> List[Any]:
+        """Bind values for the placeholders in ``_GET_BY_ID_WHERE``."""
+        return [id]
+
+    async def _fetch_by_id(self, id: UUID) -> Optional[ModelType]:
+        """Run the precomputed get_by_id query and build the model from its row."""
+        if self._get_by_id_sql is None:
+            self._get_by_id_sql = self._build_get_by_id_sql()
+        rows = await self.model._meta.db.execute_query_dict(
+            self._get_by_id_sql, self._id_lookup_values(id)
+        )
+        return self.model._init_from_db(**rows[0]) if rows else None
 
     async def create(self, **kwargs) -> ModelType:
         """Create a new record."""
@@ -19,7 +59,7 @@ class BaseRepository(Generic[ModelType]):
 
     async def get_by_id(self, id: UUID) -> Optional[ModelType]:
         """Get a record by ID."""
-        return await self.model.get_or_none(id=id, is_active=True)
+        return await self._fetch_by_id(id)
 
     async def list(
         self,
@@ -31,6 +71,28 @@ class BaseRepository(Generic[ModelType]):
         query = self.model.filter(is_active=True, **filters)
         return await query.offset(offset).limit(limit)
 
+    async def update_returning(self, id: UUID, **kwargs) -> Optional[ModelType]:
+        """
+        Update columns of a record by ID and return the updated record.
+        
+        Issues a single ``UPDATE ... RETURNING`` instead of loading the record
+        and saving it back. Only plain data fields can be updated this way;
+        ``updated_at`` is bumped like ``save()`` would.
+        """
+        meta = self.model._meta
+        kwargs["updated_at"] = timezone.now()
+        values = self._id_lookup_values(id)
+        assignments = []
+        for name, value in kwargs.items():
+            values.append(meta.fields_map[name].to_db_value(value, None))
+            assignments.append(f'"{meta.fields_db_projection[name]}" = ${len(values)}')
+        rows = await meta.db.execute_query_dict(
+            f'UPDATE "{meta.db_table}" SET {", ".join(assignments)} '
+            f"WHERE {self._GET_BY_ID_WHERE} RETURNING {self._column_list()}",
+            values
+        )
+        return self.model._init_from_db(**rows[0]) if rows else None
+
     async def update(self, id: UUID, **kwargs) -> Optional[ModelType]:
         """Update a record by ID."""
         obj = await self.get_by_id(id)
@@ -54,20 +116,25 @@ class BaseRepository(Generic[ModelType]):
 class TenantRepository(BaseRepository[ModelType]):
     """Repository class for tenant-aware models."""
 
+    __slots__ = ()
+
+    # $2 is the current tenant ID
+    _GET_BY_ID_WHERE = "id = $1 AND tenant_id = $2 AND is_active"
+
+    def _id_lookup_values(self, id: UUID) -> List[Any]:
+        """Bind values for the ID and current tenant placeholders."""
+        return [id, get_current_tenant()]
+
+    @property
+    def _tenant_filters(self) -> Dict[str, Any]:
+        """Filters restricting queries to the current tenant's active rows."""
+        return get_tenant_filters()
+
     async def create(self, **kwargs) -> ModelType:
         """Create a new record with tenant ID."""
         tenant_id = get_current_tenant()
         return await super().create(tenant_id=tenant_id, **kwargs)
 
-    async def get_by_id(self, id: UUID) -> Optional[ModelType]:
-        """Get a record by ID within tenant context."""
-        tenant_id = get_current_tenant()
-        return await self.model.get_or_none(
-            id=id,
-            tenant_id=tenant_id,
-            is_active=True
-        )
-
     async def list(
         self,
         offset: int = 0,
@@ -75,18 +142,14 @@ class TenantRepository(BaseRepository[ModelType]):
         **kwargs
     ) -> List[ModelType]:
         """List records within tenant context."""
-        tenant_id = get_current_tenant()
         return await self.model.filter(
-            tenant_id=tenant_id,
-            is_active=True,
+            **self._tenant_filters,
             **kwargs
         ).offset(offset).limit(limit)
 
     async def count(self, **filters) -> int:
         """Count records within tenant context."""
-        tenant_id = get_current_tenant()
         return await self.model.filter(
-            tenant_id=tenant_id,
-            is_active=True,
+            **self._tenant_filters,
             **filters
-        ).count() 
\ No newline at end of file
+        ).count()
@@ -6,6 +6,8 @@ from app.repositories.base import TenantRepository
 class ChatbotInstanceRepository(TenantRepository[ChatbotInstance]):
     """Repository for ChatbotInstance entities."""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(ChatbotInstance)
 
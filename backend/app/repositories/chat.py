@@ -1,15 +1,28 @@
 from typing import Optional, List, Dict, Any
 from uuid import UUID
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from app.models.chat import Conversation, Message, Feedback
 from app.repositories.base import TenantRepository
+from tortoise import timezone
+from tortoise.expressions import Subquery
+from tortoise.query_utils import Prefetch
 from app.core.security.tenancy import get_current_tenant, TenantContextManager
+from app.core.database import with_chat_relations
+
+# Message columns read back by the chat history and AI context builders
+_MESSAGE_READ_COLUMNS = ("id", "content", "role", "timestamp", "metadata", "created_at")
+
+# Message columns prefetched with a conversation for the chat UI; the
+# conversation_id is needed to attach each message to its conversation
+_MESSAGE_PROJECTION_COLUMNS = ("id", "conversation_id", "role", "content", "timestamp")
 
 
 class ConversationRepository(TenantRepository[Conversation]):
     """Repository for managing Conversation entities."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(Conversation)
 
@@ -57,12 +70,34 @@ class ConversationRepository(TenantRepository[Conversation]):
         conversation_id: UUID,
         message_limit: int = 50
     ) -> Optional[Conversation]:
-        """Get a conversation with its messages."""
-        conversation = await self.get_by_id(conversation_id)
-        if conversation:
-            # Prefetch related messages
-            await conversation.fetch_related("messages")
-        return conversation
+        """
+        Get a conversation with its latest messages.
+        
+        The latest ``message_limit`` messages are prefetched into
+        ``conversation.messages``, oldest first, with only the columns the
+        chat UI renders, so their metadata JSON is not loaded.
+        """
+        # Ids of the latest messages, picked newest first through the
+        # (tenant_id, conversation_id, timestamp) index
+        latest_ids = Subquery(
+            Message.filter(
+                conversation_id=conversation_id,
+                **self._tenant_filters
+            ).order_by("-timestamp").limit(message_limit).values("id")
+        )
+        return await with_chat_relations(
+            self.model.filter(
+                id=conversation_id,
+                **self._tenant_filters
+            )
+        ).prefetch_related(
+            Prefetch(
+                "messages",
+                queryset=Message.filter(
+                    id__in=latest_ids
+                ).order_by("timestamp").only(*_MESSAGE_PROJECTION_COLUMNS)
+            )
+        ).first()
 
     async def search_conversations(
         self,
@@ -91,6 +126,8 @@ class ConversationRepository(TenantRepository[Conversation]):
 class MessageRepository(TenantRepository[Message]):
     """Repository for managing Message entities."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(Message)
 
@@ -102,12 +139,38 @@ class MessageRepository(TenantRepository[Message]):
         metadata: Optional[Dict[str, Any]] = None
     ) -> Message:
         """Create a new message in a conversation."""
-        return await self.create(
-            conversation_id=conversation_id,
-            content=content,
-            role=role,
-            metadata=metadata
-        )
+        messages = await self.bulk_create_messages([{
+            "conversation_id": conversation_id,
+            "content": content,
+            "role": role,
+            "metadata": metadata
+        }])
+        return messages[0]
+
+    async def bulk_create_messages(
+        self,
+        rows: List[Dict[str, Any]]
+    ) -> List[Message]:
+        """
+        Create several messages with a single multi-row INSERT.
+        
+        Each row holds ``conversation_id``, ``content``, ``role`` and an
+        optional ``metadata``. Rows are timestamped in the given order, one
+        microsecond apart, so they keep that order when sorted by timestamp.
+        """
+        tenant_id = get_current_tenant()
+        now = timezone.now()
+        messages = []
+        for offset, row in enumerate(rows):
+            message = self.model(tenant_id=tenant_id, **row)
+            message.timestamp = now + timedelta(microseconds=offset)
+            messages.append(message)
+        await self.model.bulk_create(messages)
+        # bulk_create leaves the instances unsaved; mark them so a later
+        # save() updates the row instead of inserting it again
+        for message in messages:
+            message._saved_in_db = True
+        return messages
 
     async def get_conversation_messages(
         self,
@@ -115,27 +178,35 @@ class MessageRepository(TenantRepository[Message]):
         limit: int = 50,
         before_timestamp: Optional[datetime] = None
     ) -> List[Message]:
-        """Get messages from a conversation with pagination."""
+        """
+        Get the latest messages of a conversation, oldest first.
+        
+        Returns the ``limit`` most recent messages (older than
+        ``before_timestamp`` when given), so callers page backwards through
+        the history by passing the timestamp of the oldest message returned.
+        """
         filters = {"conversation_id": conversation_id}
         if before_timestamp:
             filters["timestamp__lt"] = before_timestamp
         
-        return await self.list(
-            limit=limit,
+        # Take the latest messages through the (tenant_id, conversation_id,
+        # timestamp) index, then return them oldest first
+        messages = await self.model.filter(
+            **self._tenant_filters,
             **filters
-        )
+        ).order_by("-timestamp").limit(limit).only(*_MESSAGE_READ_COLUMNS)
+        messages.reverse()
+        return messages
 
     async def get_latest_message(
         self,
         conversation_id: UUID
     ) -> Optional[Message]:
         """Get the latest message from a conversation."""
-        messages = await self.model.filter(
+        return await self.model.filter(
             conversation_id=conversation_id,
-            tenant_id=get_current_tenant(),
-            is_active=True
-        ).order_by("-timestamp").limit(1)
-        return messages[0] if messages else None
+            **self._tenant_filters
+        ).order_by("-timestamp").only(*_MESSAGE_READ_COLUMNS).first()
 
     async def count_messages(
         self,
@@ -152,6 +223,8 @@ class MessageRepository(TenantRepository[Message]):
 class FeedbackRepository(TenantRepository[Feedback]):
     """Repository for managing Feedback entities."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(Feedback)
 
@@ -171,13 +244,25 @@ class FeedbackRepository(TenantRepository[Feedback]):
         )
 
 
+# The repositories are stateless, so every ChatRepository shares one of each
+# unless it is given its own
+_CONVERSATION_REPO = ConversationRepository()
+_MESSAGE_REPO = MessageRepository()
+_FEEDBACK_REPO = FeedbackRepository()
+
+
 class ChatRepository:
     """High level repository combining conversation and message operations."""
 
-    def __init__(self) -> None:
-        self.conversation_repo = ConversationRepository()
-        self.message_repo = MessageRepository()
-        self.feedback_repo = FeedbackRepository()
+    def __init__(
+        self,
+        conversation_repo: Optional[ConversationRepository] = None,
+        message_repo: Optional[MessageRepository] = None,
+        feedback_repo: Optional[FeedbackRepository] = None,
+    ) -> None:
+        self.conversation_repo = conversation_repo or _CONVERSATION_REPO
+        self.message_repo = message_repo or _MESSAGE_REPO
+        self.feedback_repo = feedback_repo or _FEEDBACK_REPO
 
     async def get_conversation(self, conversation_id: UUID) -> Optional[Conversation]:
         """Retrieve a conversation by its ID."""
@@ -204,7 +289,7 @@ class ChatRepository:
         limit: int = 50,
         before_timestamp: Optional[datetime] = None,
     ) -> List[Message]:
-        """Retrieve messages for a conversation."""
+        """Retrieve the latest ``limit`` messages of a conversation, oldest first."""
         return await self.message_repo.get_conversation_messages(
             conversation_id=conversation_id,
             limit=limit,
@@ -228,6 +313,17 @@ class ChatRepository:
             metadata=metadata,
         )
 
+    async def create_messages(
+        self,
+        conversation_id: UUID,
+        messages: List[Dict[str, Any]],
+    ) -> List[Message]:
+        """Create several messages in a conversation with one INSERT."""
+        return await self.message_repo.bulk_create_messages([
+            {"conversation_id": conversation_id, **message}
+            for message in messages
+        ])
+
     async def create_feedback(
         self,
         message_id: UUID,
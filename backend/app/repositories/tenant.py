@@ -6,6 +6,8 @@ from app.repositories.base import BaseRepository
 class TenantRepository(BaseRepository[Tenant]):
     """Repository for managing Tenant entities."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(Tenant)
 
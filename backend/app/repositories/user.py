@@ -1,14 +1,17 @@
 from typing import Optional, List
+from datetime import datetime, timezone
+import anyio
 from uuid import UUID
 from app.models.user import User
 from app.repositories.base import TenantRepository
 from tortoise.expressions import Q
-from app.core.security.tenancy import get_current_tenant
 
 
 class UserRepository(TenantRepository[User]):
     """Repository for managing User entities."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(User)
 
@@ -35,7 +38,9 @@ class UserRepository(TenantRepository[User]):
             user_data["id"] = id
         
         if password:
-            user_data["hashed_password"] = User.hash_password(password)
+            user_data["hashed_password"] = await anyio.to_thread.run_sync(
+                User.hash_password, password
+            )
             
         # Let TenantRepository handle tenant_id from context
         return await self.create(**user_data)
@@ -52,7 +57,9 @@ class UserRepository(TenantRepository[User]):
         """Update user's password."""
         user = await self.get_by_id(user_id)
         if user:
-            user.hashed_password = User.hash_password(new_password)
+            user.hashed_password = await anyio.to_thread.run_sync(
+                User.hash_password, new_password
+            )
             await user.save(update_fields=["hashed_password"])
         return user
 
@@ -64,8 +71,7 @@ class UserRepository(TenantRepository[User]):
         """Search users by username or email."""
         return await self.model.filter(
             Q(username__icontains=search_term) | Q(email__icontains=search_term),
-            tenant_id=get_current_tenant(),
-            is_active=True
+            **self._tenant_filters
         ).limit(limit)
 
     async def update_user_profile(
@@ -90,7 +96,10 @@ class UserRepository(TenantRepository[User]):
             update_data["username"] = username
         if is_superuser is not None:
             update_data["is_superuser"] = is_superuser
+        if update_last_login:
+            # Written by the same UPDATE as the profile fields
+            update_data["last_login"] = datetime.now(timezone.utc)
 
         if update_data:
-            return await self.update(user_id, **update_data)
+            return await self.update_returning(user_id, **update_data)
         return await self.get_by_id(user_id) 
\ No newline at end of file
@@ -20,5 +20,6 @@ class ChatbotInstanceResponse(ChatbotInstanceBase):
     created_at: datetime
 
     model_config = {
+        "frozen": True,
         "from_attributes": True
     }
@@ -1,12 +1,13 @@
 from typing import List, Optional, Dict, Any
 from uuid import UUID
 from datetime import datetime
-from pydantic import BaseModel, Field, constr
-from typing import Annotated, Optional, Dict, Any
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class ChatMessageRequest(BaseModel):
-    message: Annotated[str, constr(min_length=1, max_length=4096)]
+    message: str = Field(
+        ..., min_length=1, max_length=4096, description="The user's message"
+    )
     chatbot_instance_id: UUID = Field(
         ..., description="ID of the bot instance this conversation belongs to"
     )
@@ -24,6 +25,11 @@ class ChatMessageResponse(BaseModel):
     timestamp: datetime
     metadata: Optional[Dict[str, Any]] = None
 
+    model_config = {
+        "frozen": True,
+        "from_attributes": True
+    }
+
 class ChatHistoryMessage(BaseModel):
     message_id: UUID
     content: str
@@ -31,6 +37,11 @@ class ChatHistoryMessage(BaseModel):
     timestamp: datetime
     metadata: Optional[Dict[str, Any]] = None
 
+    model_config = {
+        "frozen": True,
+        "from_attributes": True
+    }
+
 class ChatHistoryResponse(BaseModel):
     conversation_id: UUID
     chatbot_instance_id: UUID
@@ -43,11 +54,30 @@ class BotConversationResponse(BaseModel):
     chatbot_instance_id: UUID
     title: str
     last_message_at: datetime
-    
+
+    model_config = {
+        "frozen": True,
+        "from_attributes": True
+    }
+
+# Validates a whole page of conversation rows in one call
+_BOT_CONVERSATIONS_ADAPTER = TypeAdapter(List[BotConversationResponse])
+
 class BotConversationsListResponse(BaseModel):
     conversations: List[BotConversationResponse]
     total: int
 
+    @classmethod
+    def from_rows(cls, rows: List[Dict[str, Any]]) -> "BotConversationsListResponse":
+        """Build the response from conversation dicts, validating them once."""
+        conversations = _BOT_CONVERSATIONS_ADAPTER.validate_python(rows)
+        # The items are validated above and total is derived, so the outer
+        # model needs no second validation pass
+        return cls.model_construct(
+            conversations=conversations,
+            total=len(conversations)  # In a real implementation, would get actual total count
+        )
+
 class FeedbackRequest(BaseModel):
     message_id: UUID
     rating: int = Field(..., ge=1, le=5)
@@ -5,11 +5,13 @@ This module provides integration with the external AI service supporting both
 OpenAI and Llama.cpp models.
 """
 
-import json
 import hashlib
+import time
+import orjson
+from collections import OrderedDict
 from datetime import timedelta
 import httpx
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from enum import Enum
 from pydantic import BaseModel
 import redis.asyncio as redis
@@ -36,6 +38,79 @@ class AIResponse(BaseModel):
     model_used: str
     tokens_used: int
 
+# Redis connections shared by every AIService; the service is built per
+# request, so a pool per instance would reconnect on every request
+REDIS_MAX_CONNECTIONS = 32
+_redis_pool: Optional[redis.ConnectionPool] = None
+
+def _get_redis_pool(redis_url: str) -> redis.ConnectionPool:
+    """Get the process-wide Redis connection pool, creating it on first use."""
+    global _redis_pool
+    if _redis_pool is None:
+        _redis_pool = redis.ConnectionPool.from_url(
+            redis_url,
+            max_connections=REDIS_MAX_CONNECTIONS,
+            encoding="utf-8",
+            decode_responses=True
+        )
+    return _redis_pool
+
+# HTTP client for the AI service, shared like the Redis pool so keep-alive
+# connections survive between requests instead of reconnecting per turn
+AI_HTTP_LIMITS = httpx.Limits(
+    max_connections=500,
+    max_keepalive_connections=200,
+    keepalive_expiry=60.0
+)
+_http_client: Optional[httpx.AsyncClient] = None
+
+def _get_http_client(settings: Settings) -> httpx.AsyncClient:
+    """Get the process-wide AI service HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            base_url=settings.AI_SERVICE_URL,
+            timeout=settings.AI_TIMEOUT_SECONDS,
+            # Retry a failed connect once, e.g. after the AI service restarted
+            transport=httpx.AsyncHTTPTransport(limits=AI_HTTP_LIMITS, retries=1)
+        )
+    return _http_client
+
+async def close_ai_clients() -> None:
+    """Close the connections shared by AIService instances (at shutdown)."""
+    global _redis_pool, _http_client
+    if _redis_pool is not None:
+        await _redis_pool.disconnect()
+        _redis_pool = None
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+# In-process cache in front of Redis, so a request repeated within seconds
+# (retries, resubmits) skips the Redis round trip. Entries are
+# (stored at, response), least recently used first.
+LOCAL_CACHE_SIZE = 1024
+LOCAL_CACHE_TTL_SECONDS = 60.0
+_local_cache: "OrderedDict[str, Tuple[float, AIResponse]]" = OrderedDict()
+
+def _local_cache_get(cache_key: str) -> Optional[AIResponse]:
+    """Get a fresh response from the in-process cache."""
+    entry = _local_cache.get(cache_key)
+    if entry is None:
+        return None
+    if time.monotonic() - entry[0] > LOCAL_CACHE_TTL_SECONDS:
+        del _local_cache[cache_key]
+        return None
+    _local_cache.move_to_end(cache_key)
+    return entry[1]
+
+def _local_cache_set(cache_key: str, response: AIResponse) -> None:
+    """Store a response in the in-process cache, evicting the oldest entry."""
+    _local_cache[cache_key] = (time.monotonic(), response)
+    _local_cache.move_to_end(cache_key)
+    if len(_local_cache) > LOCAL_CACHE_SIZE:
+        _local_cache.popitem(last=False)
+
 class AIService:
     """
     Service for interacting with AI models through the external AI service.
@@ -52,18 +127,11 @@ class AIService:
             settings: Application settings containing AI service configuration
         """
         self.settings = settings
-        self.client = httpx.AsyncClient(
-            base_url=settings.AI_SERVICE_URL,
-            timeout=settings.AI_TIMEOUT_SECONDS
-        )
+        self.client = _get_http_client(settings)
         self.fallback_enabled = settings.AI_FALLBACK_ENABLED
         
-        # Initialize Redis connection
-        self.redis = redis.from_url(
-            settings.redis_url,
-            encoding="utf-8",
-            decode_responses=True
-        )
+        # Redis client on the shared connection pool
+        self.redis = redis.Redis(connection_pool=_get_redis_pool(settings.redis_url))
         
         # Cache settings
         self.cache_ttl = timedelta(hours=24)  # Cache responses for 24 hours
@@ -93,9 +161,10 @@ class AIService:
             "model_type": model_type.value
         }
         
-        # Generate a hash of the request data
-        cache_string = json.dumps(cache_data, sort_keys=True)
-        return f"ai_response:{hashlib.sha256(cache_string.encode()).hexdigest()}"
+        # Hash the request data; the key only deduplicates requests, so a
+        # fast 128-bit BLAKE2b digest is used rather than SHA-256
+        cache_bytes = orjson.dumps(cache_data, option=orjson.OPT_SORT_KEYS)
+        return f"ai_response_b2:{hashlib.blake2b(cache_bytes, digest_size=16).hexdigest()}"
 
     async def _get_cached_response(self, cache_key: str) -> Optional[AIResponse]:
         """
@@ -109,18 +178,27 @@ class AIService:
         """
         if not self.cache_enabled:
             return None
+        
+        response = _local_cache_get(cache_key)
+        if response is not None:
+            log_chat_event(
+                event_type="ai_cache_hit",
+                extra={"cache_key": cache_key, "cache_layer": "local"}
+            )
+            return response
             
         try:
             cached = await self.redis.get(cache_key)
             if cached:
-                response_data = json.loads(cached)
-                await log_chat_event(
+                response = AIResponse.model_validate_json(cached)
+                _local_cache_set(cache_key, response)
+                log_chat_event(
                     event_type="ai_cache_hit",
-                    cache_key=cache_key
+                    extra={"cache_key": cache_key}
                 )
-                return AIResponse(**response_data)
+                return response
         except Exception as e:
-            await log_chat_event(
+            log_chat_event(
                 event_type="ai_cache_error",
                 error_type=str(type(e).__name__),
                 error_message=str(e)
@@ -137,19 +215,21 @@ class AIService:
         """
         if not self.cache_enabled:
             return
+        
+        _local_cache_set(cache_key, response)
             
         try:
             await self.redis.set(
                 cache_key,
-                json.dumps(response.model_dump()),
+                response.model_dump_json(),
                 ex=int(self.cache_ttl.total_seconds())
             )
-            await log_chat_event(
+            log_chat_event(
                 event_type="ai_cache_store",
-                cache_key=cache_key
+                extra={"cache_key": cache_key}
             )
         except Exception as e:
-            await log_chat_event(
+            log_chat_event(
                 event_type="ai_cache_error",
                 error_type=str(type(e).__name__),
                 error_message=str(e)
@@ -175,62 +255,61 @@ class AIService:
         Raises:
             AIServiceError: If both primary and fallback attempts fail
         """
-        # Try to get cached response first
-        cache_key = self._generate_cache_key(message, context, model_type)
-        cached_response = await self._get_cached_response(cache_key)
+        # Try the requested model, then Llama as the fallback if enabled and
+        # not already requested. Each model's responses are cached under
+        # their own key.
+        model_types = [model_type]
+        if self.fallback_enabled and model_type != ModelType.LLAMA:
+            model_types.append(ModelType.LLAMA)
         
-        if cached_response:
-            return cached_response.content
+        for attempt, attempt_model in enumerate(model_types):
+            cache_key = self._generate_cache_key(message, context, attempt_model)
+            cached_response = await self._get_cached_response(cache_key)
             
-        try:
-            response = await self._call_ai_service(
-                message=message,
-                context=context,
-                model_type=model_type
-            )
+            if cached_response:
+                return cached_response.content
+            
+            try:
+                response = await self._call_ai_service(
+                    message=message,
+                    context=context,
+                    model_type=attempt_model
+                )
+            except Exception as e:
+                # Log the error
+                log_chat_event(
+                    event_type="ai_error",
+                    error_type=str(type(e).__name__),
+                    error_message=str(e),
+                    model_type=attempt_model.value
+                )
+                
+                if attempt == 0 and len(model_types) > 1:
+                    # Attempt with Llama as fallback
+                    continue
+                if attempt > 0:
+                    # Log fallback error
+                    log_chat_event(
+                        event_type="ai_fallback_error",
+                        error_type=str(type(e).__name__),
+                        error_message=str(e)
+                    )
+                    raise AIServiceError(
+                        "Both primary and fallback AI attempts failed"
+                    ) from e
+                raise AIServiceError(str(e)) from e
             
             # Cache the successful response
             await self._cache_response(cache_key, response)
             
             # Log successful AI call
-            await log_chat_event(
+            log_chat_event(
                 event_type="ai_response_generated",
-                model_type=model_type.value,
-                tokens_used=response.tokens_used
+                model_type=attempt_model.value,
+                extra={"tokens_used": response.tokens_used}
             )
             
             return response.content
-            
-        except Exception as e:
-            # Log the error
-            await log_chat_event(
-                event_type="ai_error",
-                error_type=str(type(e).__name__),
-                error_message=str(e),
-                model_type=model_type.value
-            )
-            
-            # Try fallback if enabled and not already using fallback
-            if self.fallback_enabled and model_type != ModelType.LLAMA:
-                try:
-                    # Attempt with Llama as fallback
-                    return await self.generate_response(
-                        message=message,
-                        context=context,
-                        model_type=ModelType.LLAMA
-                    )
-                except Exception as fallback_error:
-                    # Log fallback error
-                    await log_chat_event(
-                        event_type="ai_fallback_error",
-                        error_type=str(type(fallback_error).__name__),
-                        error_message=str(fallback_error)
-                    )
-                    raise AIServiceError(
-                        "Both primary and fallback AI attempts failed"
-                    ) from fallback_error
-            
-            raise AIServiceError(str(e)) from e
 
     async def _call_ai_service(
         self,
@@ -258,16 +337,18 @@ class AIService:
             context=context if context is not None else [],  # Ensure list
             model_type=model_type.value  # Convert enum to string
         )
+        payload = request.model_dump()
         # Debug log outgoing payload
-        logging.getLogger(__name__).info(f"Sending to AI service: {request.model_dump()}")
+        logging.getLogger(__name__).info(f"Sending to AI service: {payload}")
         response = await self.client.post(
             "/api/v1/generate",
-            json=request.model_dump()
+            json=payload
         )
         if response.status_code != 200:
             logging.getLogger(__name__).error(f"AI service error response: {response.text}")
         response.raise_for_status()
-        return AIResponse(**response.json())
+        # Validate the raw body directly rather than decoding it to a dict first
+        return AIResponse.model_validate_json(response.content)
 
 class AIServiceError(Exception):
     """Raised when the AI service encounters an error"""
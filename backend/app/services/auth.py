@@ -1,21 +1,25 @@
 from fastapi import Depends, HTTPException, status, Request
-from jose import jwt, JWTError
-from jose.constants import ALGORITHMS
-from cryptography.hazmat.primitives.asymmetric.rsa import RSAPublicNumbers
-from cryptography.hazmat.backends import default_backend
-from cryptography.hazmat.primitives import serialization
-from typing import List, Dict, Any, Optional
+import jwt
+from jwt import PyJWTError
+from jwt.algorithms import RSAAlgorithm
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPublicKey
+from typing import List, Dict, Any, Optional, Tuple
+from collections import OrderedDict
 from pydantic import BaseModel
 import httpx
+import asyncio
+import hashlib
+import time
 import os
 import logging
 import base64
+import orjson
 from uuid import UUID
 from app.repositories.user import UserRepository
 from app.core.security.tenancy import TenantContextManager
 from app.core.monitoring import log_security_event
 from app.services.tenant import TenantService
-from app.core.security.exceptions import TenantMismatchError
+from app.core.security.exceptions import TenantMismatchError, AuthenticationError
 from fastapi.security import OAuth2PasswordBearer
 from app.core.config.settings import get_settings
 from app.models.user import User
@@ -47,47 +51,170 @@ class UserToken(BaseModel):
             return []
         return self.payload['realm_access'].get('roles', [])
 
-def decode_value(val: str) -> int:
-    """Decode JWT base64 value to integer."""
-    decoded = base64.urlsafe_b64decode(val + '=' * (-len(val) % 4))
-    return int.from_bytes(decoded, 'big')
+# Keycloak signing keys are cached for this long before being refetched;
+# rotated keys with an unknown kid trigger an earlier refresh
+JWKS_CACHE_TTL_SECONDS = 600
+JWKS_CACHE_MAX_TTL_SECONDS = 3600
+# Minimum time between two JWKS fetches, so tokens with unknown kids (or a
+# failing Keycloak) cannot turn every request into a fetch
+JWKS_REFRESH_COOLDOWN_SECONDS = 10.0
 
-def jwk_to_public_key(jwk: dict) -> str:
-    """Convert JWK to PEM format."""
-    e = decode_value(jwk['e'])
-    n = decode_value(jwk['n'])
-    
-    public_numbers = RSAPublicNumbers(e=e, n=n)
-    public_key = public_numbers.public_key(backend=default_backend())
+class JWKSCache:
+    """
+    In-process cache of the Keycloak JWKS, indexed by key ID.
     
-    pem = public_key.public_bytes(
-        encoding=serialization.Encoding.PEM,
-        format=serialization.PublicFormat.SubjectPublicKeyInfo
-    )
-    return pem
+    Replaces fetching the certs endpoint on every authenticated request.
+    Refreshes are serialized by a lock, so concurrent misses share one fetch
+    over a long-lived HTTP client, and are at most one per
+    ``JWKS_REFRESH_COOLDOWN_SECONDS``, misses or not.
+    """
 
-async def get_jwks() -> Dict[str, Any]:
-    """Fetch JWKS from Keycloak."""
-    async with httpx.AsyncClient() as client:
+    def __init__(self, jwks_url: str, ttl_seconds: float = JWKS_CACHE_TTL_SECONDS):
+        self.jwks_url = jwks_url
+        self.ttl_seconds = min(ttl_seconds, JWKS_CACHE_MAX_TTL_SECONDS)
+        self.keys: Dict[str, Dict[str, Any]] = {}
+        # Loaded public keys of the RSA signing JWKs, by key ID
+        self.signing_keys: Dict[str, RSAPublicKey] = {}
+        self.expires_at = 0.0
+        self.last_refresh_attempt = float("-inf")
+        self.lock = asyncio.Lock()
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _is_fresh(self) -> bool:
+        return time.monotonic() < self.expires_at
+
+    async def refresh(self) -> None:
+        """Fetch the JWKS from Keycloak and replace the cached keys."""
+        self.last_refresh_attempt = time.monotonic()
+        if self._client is None:
+            self._client = httpx.AsyncClient()
         try:
-            resp = await client.get(KEYCLOAK_JWKS_URL)
+            resp = await self._client.get(self.jwks_url)
             resp.raise_for_status()
-            return resp.json()
+            jwks = resp.json()
         except Exception as e:
-            logger.error(f"Failed to fetch JWKS from {KEYCLOAK_JWKS_URL}: {str(e)}")
+            logger.error(f"Failed to fetch JWKS from {self.jwks_url}: {str(e)}")
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail="Authentication service unavailable"
             )
+        keys = {key["kid"]: key for key in jwks.get("keys", []) if "kid" in key}
+        # Parse each public key once per refresh instead of on every request
+        signing_keys = {}
+        for kid, key in keys.items():
+            if key.get("kty") == "RSA" and key.get("use", "sig") == "sig":
+                try:
+                    signing_keys[kid] = build_signing_key(key)
+                except Exception as e:
+                    logger.error(f"Failed to load JWKS key {kid}: {str(e)}")
+        self.keys, self.signing_keys = keys, signing_keys
+        self.expires_at = time.monotonic() + self.ttl_seconds
 
-async def get_current_user(token: str = Depends(oauth2_scheme)) -> UserToken:
-    """Dependency to get the current authenticated user from the token."""
-    if not token:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Not authenticated"
-        )
-        
+    async def _refresh_if_due(self) -> None:
+        """Refresh the keys unless a fetch was attempted within the cooldown."""
+        async with self.lock:
+            # Requests waiting on the lock find the fetch they queued behind
+            # inside the cooldown and reuse its result
+            if time.monotonic() - self.last_refresh_attempt < JWKS_REFRESH_COOLDOWN_SECONDS:
+                return
+            await self.refresh()
+
+    async def get_key(self, kid: str) -> Optional[Dict[str, Any]]:
+        """Get the JWK for a key ID, refreshing the cache if stale or unknown."""
+        if self._is_fresh() and kid in self.keys:
+            return self.keys[kid]
+        await self._refresh_if_due()
+        return self.keys.get(kid)
+
+    async def get_signing_key(self, kid: str) -> Optional[RSAPublicKey]:
+        """Get the loaded public key for a key ID (see ``get_key``)."""
+        if self._is_fresh() and kid in self.signing_keys:
+            return self.signing_keys[kid]
+        await self._refresh_if_due()
+        return self.signing_keys.get(kid)
+
+    async def get_jwks(self) -> Dict[str, Any]:
+        """Get the cached JWKS document, refreshing it if stale."""
+        if not self._is_fresh():
+            await self._refresh_if_due()
+        return {"keys": list(self.keys.values())}
+
+    async def close(self) -> None:
+        """Close the HTTP client used for refreshes."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+jwks_cache = JWKSCache(
+    KEYCLOAK_JWKS_URL,
+    ttl_seconds=float(os.getenv("KEYCLOAK_JWKS_TTL_SECONDS", JWKS_CACHE_TTL_SECONDS))
+)
+
+def build_signing_key(key: Dict[str, Any]) -> RSAPublicKey:
+    """Load the RSA public key of a JWK for RS256 verification."""
+    return RSAAlgorithm.from_jwk(key)
+
+def decode_token_header(token: str) -> Dict[str, Any]:
+    """
+    Decode the header segment of a JWT without verifying the token.
+    
+    Only the header is base64- and JSON-decoded, where
+    ``jwt.get_unverified_header`` decodes every segment of the token.
+    """
+    header_b64 = token.split(".", 1)[0]
+    try:
+        header = orjson.loads(base64.urlsafe_b64decode(header_b64 + "=" * (-len(header_b64) % 4)))
+    except ValueError as e:
+        raise jwt.DecodeError(f"Invalid header: {e}") from e
+    if not isinstance(header, dict):
+        raise jwt.DecodeError("Invalid header: not a JSON object")
+    return header
+
+async def get_jwks() -> Dict[str, Any]:
+    """Fetch JWKS from Keycloak (cached, see ``jwks_cache``)."""
+    return await jwks_cache.get_jwks()
+
+async def close_auth_clients() -> None:
+    """Close the connections shared by the auth service (at shutdown)."""
+    await jwks_cache.close()
+
+# Validated tokens, keyed by a BLAKE2b digest of the token, so repeated
+# requests with the same bearer token skip signature verification. Entries
+# are (expires at, user), least recently used first; they expire with the
+# token or after TOKEN_CACHE_MAX_TTL_SECONDS, whichever is sooner.
+TOKEN_CACHE_SIZE = 10_000
+TOKEN_CACHE_MAX_TTL_SECONDS = 300.0
+_token_cache: "OrderedDict[bytes, Tuple[float, UserToken]]" = OrderedDict()
+# Decodes in progress, so a burst of requests with a new token verifies it once
+_token_inflight: Dict[bytes, "asyncio.Future[UserToken]"] = {}
+
+def _token_cache_get(cache_key: bytes) -> Optional[UserToken]:
+    """Get an unexpired user from the token cache."""
+    entry = _token_cache.get(cache_key)
+    if entry is None:
+        return None
+    if time.time() >= entry[0]:
+        del _token_cache[cache_key]
+        return None
+    _token_cache.move_to_end(cache_key)
+    return entry[1]
+
+def _token_cache_set(cache_key: bytes, user: UserToken) -> None:
+    """Cache a validated user until its token expires, evicting the oldest entry."""
+    now = time.time()
+    expires_at = now + TOKEN_CACHE_MAX_TTL_SECONDS
+    exp = user.payload.get("exp")
+    if isinstance(exp, (int, float)):
+        expires_at = min(expires_at, exp)
+    if expires_at <= now:
+        return
+    _token_cache[cache_key] = (expires_at, user)
+    _token_cache.move_to_end(cache_key)
+    if len(_token_cache) > TOKEN_CACHE_SIZE:
+        _token_cache.popitem(last=False)
+
+async def _authenticate(token: str) -> UserToken:
+    """Decode and validate a token, mapping any failure to a 401."""
     auth_service = AuthService()
     try:
         # Decode token without tenant context
@@ -99,6 +226,39 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> UserToken:
             detail=f"Authentication failed: {str(e)}"
         )
 
+async def get_current_user(token: str = Depends(oauth2_scheme)) -> UserToken:
+    """Dependency to get the current authenticated user from the token."""
+    if not token:
+        raise AuthenticationError("Not authenticated")
+    
+    cache_key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    user = _token_cache_get(cache_key)
+    if user is not None:
+        # Callers get their own copy, since UserToken is mutable
+        return user.model_copy()
+    
+    inflight = _token_inflight.get(cache_key)
+    if inflight is not None:
+        return (await asyncio.shield(inflight)).model_copy()
+    
+    future: "asyncio.Future[UserToken]" = asyncio.get_running_loop().create_future()
+    _token_inflight[cache_key] = future
+    try:
+        user = await _authenticate(token)
+        future.set_result(user)
+    except Exception as e:
+        future.set_exception(e)
+        # Mark the exception retrieved in case no request was waiting on it
+        future.exception()
+        raise
+    finally:
+        del _token_inflight[cache_key]
+        if not future.done():
+            # This request was cancelled mid-decode
+            future.cancel()
+    _token_cache_set(cache_key, user)
+    return user.model_copy()
+
 async def get_current_user_roles(user: UserToken = Depends(get_current_user)) -> List[str]:
     """Dependency to get current user's roles from the token."""
     return user.get_roles()
@@ -149,7 +309,7 @@ async def sync_user_with_db(user_token: UserToken) -> UUID:
                 logger.info(f"Created new user from Keycloak: {user_token.preferred_username}")
                 
                 # Log user creation
-                await log_security_event(
+                log_security_event(
                     event_type="USER_CREATED_FROM_KEYCLOAK",
                     tenant_id=str(tenant_id),
                     user_id=str(user.id),
@@ -158,17 +318,19 @@ async def sync_user_with_db(user_token: UserToken) -> UUID:
                         "success": True
                     }
                 )
+                
+                # Update last login timestamp
+                await user.update_last_login()
             else:
-                # Update all user fields that might have changed
+                # Update all user fields that might have changed, together
+                # with the last login timestamp
                 user = await user_repo.update_user_profile(
                     user_id=user.id,
+                    update_last_login=True,
                     **user_data
                 )
                 logger.debug(f"Updated user profile from Keycloak: {user_token.preferred_username}")
             
-            # Update last login timestamp
-            await user.update_last_login()
-            
             # Return the final tenant_id
             return tenant_id
                 
@@ -177,7 +339,7 @@ async def sync_user_with_db(user_token: UserToken) -> UUID:
         logger.error(error_msg)
         
         # Log the error
-        await log_security_event(
+        log_security_event(
             event_type="USER_SYNC_ERROR",
             tenant_id=str(tenant_id),
             user_id=user_token.sub,
@@ -203,43 +365,21 @@ class AuthService:
         self.settings = get_settings()
         self.user_repository = UserRepository()
         self.tenant_service = TenantService()
-        self.keycloak_certs = None
-        
-    async def get_keycloak_public_key(self):
-        """Fetch Keycloak public key for JWT verification."""
-        if self.keycloak_certs:
-            return self.keycloak_certs
-            
-        # Use the constant instead of settings attribute
-        keycloak_url = KEYCLOAK_JWKS_URL
         
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(keycloak_url)
-                response.raise_for_status()
-                self.keycloak_certs = response.json()
-                return self.keycloak_certs
-        except Exception as e:
-            logger.error(f"Failed to fetch Keycloak public key: {str(e)}")
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="Authentication service unavailable"
-            )
-    
     async def decode_token(self, token: str) -> UserToken:
         """Decode and validate JWT token from Keycloak."""
         try:
-            certs = await self.get_keycloak_public_key()
-            
-            # For debugging, log the unverified claims
-            try:
-                unverified_claims = jwt.get_unverified_claims(token)
-                logger.debug(f"Token unverified claims: {unverified_claims}")
-            except Exception as e:
-                logger.debug(f"Failed to decode unverified claims: {e}")
+            # For debugging, log the unverified claims (only decoded when
+            # debug logging is on)
+            if logger.isEnabledFor(logging.DEBUG):
+                try:
+                    unverified_claims = jwt.decode(token, options={"verify_signature": False})
+                    logger.debug(f"Token unverified claims: {unverified_claims}")
+                except Exception as e:
+                    logger.debug(f"Failed to decode unverified claims: {e}")
             
             # Extract kid from token header
-            header = jwt.get_unverified_header(token)
+            header = decode_token_header(token)
             kid = header.get('kid')
             
             if not kid:
@@ -248,50 +388,15 @@ class AuthService:
                     detail="Invalid token header"
                 )
                 
-            # Find matching key
-            key = None
-            for cert in certs.get('keys', []):
-                if cert.get('kid') == kid:
-                    key = cert
-                    break
-                    
-            if not key:
-                # Refresh certs and try again (may have rotated)
-                self.keycloak_certs = None
-                certs = await self.get_keycloak_public_key()
-                
-                for cert in certs.get('keys', []):
-                    if cert.get('kid') == kid:
-                        key = cert
-                        break
+            # Find matching key; an unknown kid refreshes the cached keys
+            # in case they were rotated
+            public_key = await jwks_cache.get_signing_key(kid)
                         
-            if not key:
+            if public_key is None:
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail="Invalid token signature"
                 )
-                
-            # Fix: Correct PEM format for X.509 certificate
-            if 'x5c' in key and key['x5c']:
-                # Format as X.509 certificate 
-                public_key = f"-----BEGIN CERTIFICATE-----\n{key['x5c'][0]}\n-----END CERTIFICATE-----"
-            else:
-                # Fallback to RSA key if no x5c
-                n = base64.urlsafe_b64decode(key['n'] + '=' * (-len(key['n']) % 4))
-                e = base64.urlsafe_b64decode(key['e'] + '=' * (-len(key['e']) % 4))
-                
-                numbers = RSAPublicNumbers(
-                    e=int.from_bytes(e, 'big'),
-                    n=int.from_bytes(n, 'big')
-                )
-                
-                public_key = numbers.public_key(backend=default_backend()).public_bytes(
-                    encoding=serialization.Encoding.PEM,
-                    format=serialization.PublicFormat.SubjectPublicKeyInfo
-                )
-                
-                # Convert bytes to string
-                public_key = public_key.decode('utf-8')
             
             # TEMPORARY: For debugging, make validation more lenient
             # In production, remove these options and use strict validation
@@ -308,7 +413,7 @@ class AuthService:
             except Exception as e:
                 logger.error(f"Lenient token validation failed: {str(e)}")
                 # Fall back to just getting the claims without verification
-                payload = jwt.get_unverified_claims(token)
+                payload = jwt.decode(token, options={"verify_signature": False})
                 logger.warning("Using unverified token claims - FOR DEBUGGING ONLY")
             
             # Create UserToken from payload (tenant_id can be None)
@@ -322,7 +427,7 @@ class AuthService:
                 payload=payload
             )
             
-        except JWTError as e:
+        except PyJWTError as e:
             logger.error(f"JWT error: {str(e)}")
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -357,7 +462,7 @@ class AuthService:
                         last_name=token.family_name
                     )
                     
-                    await log_security_event(
+                    log_security_event(
                         event_type="USER_CREATED_FROM_KEYCLOAK",
                         user_id=token.sub,
                         tenant_id=str(tenant_id),
@@ -373,7 +478,7 @@ class AuthService:
                 
         except Exception as e:
             logger.error(f"Error syncing user with database: {str(e)}")
-            await log_security_event(
+            log_security_event(
                 event_type="USER_SYNC_ERROR",
                 user_id=token.sub,
                 tenant_id=str(tenant_id),
@@ -81,12 +81,12 @@ class ChatService:
                 
                 # Verify tenant ownership
                 if conversation.tenant_id != tenant_id:
-                    await log_chat_event(
+                    log_chat_event(
                         event_type="security_violation",
                         user_id=user_id,
                         tenant_id=tenant_id,
                         conversation_id=conversation_id,
-                        details="Tenant mismatch in conversation access"
+                        extra={"details": "Tenant mismatch in conversation access"}
                     )
                     raise TenantMismatchError(
                         f"Conversation {conversation_id} does not belong to tenant {tenant_id}"
@@ -94,12 +94,12 @@ class ChatService:
                     
                 # Verify bot instance ownership
                 if conversation.chatbot_instance_id != chatbot_instance_id:
-                    await log_chat_event(
+                    log_chat_event(
                         event_type="security_violation",
                         user_id=user_id,
                         tenant_id=tenant_id,
                         conversation_id=conversation_id,
-                        details="Bot instance mismatch in conversation access"
+                        extra={"details": "Bot instance mismatch in conversation access"}
                     )
                     raise HTTPException(
                         status_code=400,
@@ -113,7 +113,7 @@ class ChatService:
                 chatbot_instance_id=chatbot_instance_id
             )
         except Exception as e:
-            await log_chat_event(
+            log_chat_event(
                 event_type="conversation_error",
                 user_id=user_id,
                 tenant_id=tenant_id,
@@ -188,16 +188,16 @@ class ChatService:
             
             # If prompt is blocked, return appropriate response
             if not filter_result.is_allowed:
-                await log_chat_event(
+                log_chat_event(
                     event_type="message_blocked",
                     user_id=user_id,
                     tenant_id=tenant_id,
                     chatbot_instance_id=chatbot_instance_id,
-                    details={
+                    extra={"details": {
                         "filter_action": filter_result.action,
                         "triggered_filters": filter_result.triggered_filters,
                         "moderation_flagged": filter_result.moderation_flagged
-                    }
+                    }}
                 )
                 
                 # Create a system message to store the blocked attempt
@@ -205,21 +205,22 @@ class ChatService:
                     user_id, tenant_id, chatbot_instance_id, conversation_id
                 )
                 
-                # Store the original user message (for audit purposes)
-                await self.chat_repository.create_message(
+                # Store the original user message (for audit purposes) and
+                # the system response in one write
+                _, system_message = await self.chat_repository.create_messages(
                     conversation_id=conversation.id,
-                    content=message,
-                    role="user",
-                    user_id=user_id,
-                    metadata={"blocked": True, "filter_result": filter_result.model_dump()}
-                )
-                
-                # Store the system response
-                system_message = await self.chat_repository.create_message(
-                    conversation_id=conversation.id,
-                    content=filter_result.message or "🚫 Your message was blocked by our content filter.",
-                    role="system",
-                    metadata={"filter_block": True}
+                    messages=[
+                        {
+                            "content": message,
+                            "role": "user",
+                            "metadata": {"blocked": True, "filter_result": filter_result.model_dump()}
+                        },
+                        {
+                            "content": filter_result.message or "🚫 Your message was blocked by our content filter.",
+                            "role": "system",
+                            "metadata": {"filter_block": True}
+                        }
+                    ]
                 )
                 
                 return {
@@ -236,14 +237,14 @@ class ChatService:
             
             # Log sanitization if it occurred
             if filter_result.action == FilterAction.SANITIZE:
-                await log_chat_event(
+                log_chat_event(
                     event_type="message_sanitized",
                     user_id=user_id,
                     tenant_id=tenant_id,
                     chatbot_instance_id=chatbot_instance_id,
-                    details={
+                    extra={"details": {
                         "triggered_filters": filter_result.triggered_filters
-                    }
+                    }}
                 )
             
             # Get or create conversation
@@ -286,31 +287,33 @@ class ChatService:
                     "triggered_filters": filter_result.triggered_filters
                 })
             
-            user_message = await self.chat_repository.create_message(
+            # Store the user message and the AI response in one write
+            user_message, ai_message = await self.chat_repository.create_messages(
                 conversation_id=conversation.id,
-                content=masked_message,
-                role="user",
-                user_id=user_id,
-                metadata=user_message_metadata if user_message_metadata else None
-            )
-            
-            ai_message = await self.chat_repository.create_message(
-                conversation_id=conversation.id,
-                content=masked_ai_response,
-                role="assistant"
+                messages=[
+                    {
+                        "content": masked_message,
+                        "role": "user",
+                        "metadata": user_message_metadata if user_message_metadata else None
+                    },
+                    {
+                        "content": masked_ai_response,
+                        "role": "assistant"
+                    }
+                ]
             )
             
             # Log successful event
-            await log_chat_event(
+            log_chat_event(
                 event_type="message_processed",
                 user_id=user_id,
                 tenant_id=tenant_id,
                 conversation_id=conversation.id,
                 model_type=model_type.value,
-                details={
+                extra={"details": {
                     "filter_applied": filter_result.action != FilterAction.ALLOW,
                     "sanitized": filter_result.action == FilterAction.SANITIZE
-                }
+                }}
             )
             
             # Prepare response with sanitization warning if applicable
@@ -331,7 +334,7 @@ class ChatService:
             
         except Exception as e:
             # Log error event
-            await log_chat_event(
+            log_chat_event(
                 event_type="message_processing_error",
                 user_id=user_id,
                 tenant_id=tenant_id,
@@ -371,7 +374,7 @@ class ChatService:
                 "messages": history,
             }
         except Exception as e:
-            await log_chat_event(
+            log_chat_event(
                 event_type="history_error",
                 user_id=user_id,
                 tenant_id=tenant_id,
@@ -396,11 +399,11 @@ class ChatService:
                 rating=rating,
                 comment=comment,
             )
-            await log_chat_event(
+            log_chat_event(
                 event_type="feedback_received",
                 user_id=user_id,
                 message_id=message_id,
-                rating=rating,
+                extra={"rating": rating},
             )
             return {
                 "feedback_id": feedback.id,
@@ -410,7 +413,7 @@ class ChatService:
                 "created_at": feedback.created_at,
             }
         except Exception as e:
-            await log_chat_event(
+            log_chat_event(
                 event_type="feedback_error",
                 user_id=user_id,
                 message_id=message_id,
@@ -461,7 +464,7 @@ class ChatService:
                 for conv in user_conversations
             ]
         except Exception as e:
-            await log_chat_event(
+            log_chat_event(
                 event_type="bot_conversations_error",
                 user_id=user_id,
                 tenant_id=tenant_id,
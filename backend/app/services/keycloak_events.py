@@ -47,7 +47,7 @@ async def handle_keycloak_event(event_type: str, user_data: dict) -> None:
                 logger.info(f"Updated user profile: {user_data['username']}")
                 
             # Log the event
-            await log_security_event(
+            log_security_event(
                 event_type=f"KEYCLOAK_{event_type}",
                 tenant_id=str(user.tenant_id),
                 user_id=str(user.id),
@@ -60,7 +60,7 @@ async def handle_keycloak_event(event_type: str, user_data: dict) -> None:
     except Exception as e:
         error_msg = f"Error handling Keycloak event: {str(e)}"
         logger.error(error_msg)
-        await log_security_event(
+        log_security_event(
             event_type=f"KEYCLOAK_{event_type}_ERROR",
             tenant_id=user_data.get("tenant_id"),
             user_id=user_data.get("sub"),
@@ -487,7 +487,7 @@ class PromptFilterService:
                     max_length=max_length
                 )
                 
-                await log_security_event(
+                log_security_event(
                     event_type="PROMPT_LENGTH_EXCEEDED",
                     user_id=user_id,
                     tenant_id=tenant_id,
@@ -518,7 +518,7 @@ class PromptFilterService:
                 )
                 
                 # Log blocked content (without the actual content for security)
-                await log_security_event(
+                log_security_event(
                     event_type="PROMPT_BLOCKED_REGEX",
                     user_id=user_id,
                     tenant_id=tenant_id,
@@ -554,7 +554,7 @@ class PromptFilterService:
                         total_processing_time_ms=round(total_time * 1000, 2)
                     )
                     
-                    await log_security_event(
+                    log_security_event(
                         event_type="PROMPT_BLOCKED_MODERATION",
                         user_id=user_id,
                         tenant_id=tenant_id,
@@ -596,7 +596,7 @@ class PromptFilterService:
                     total_processing_time_ms=round(total_time * 1000, 2)
                 )
                 
-                await log_security_event(
+                log_security_event(
                     event_type="PROMPT_SANITIZED",
                     user_id=user_id,
                     tenant_id=tenant_id,
@@ -629,7 +629,7 @@ class PromptFilterService:
             )
             
             # Log the error
-            await log_security_event(
+            log_security_event(
                 event_type="PROMPT_FILTER_ERROR",
                 user_id=user_id,
                 tenant_id=tenant_id,
@@ -35,7 +35,7 @@ class TenantService:
             )
             
             # Log tenant creation
-            await log_security_event(
+            log_security_event(
                 event_type="TENANT_CREATED",
                 tenant_id=str(tenant.id),
                 details={
@@ -48,7 +48,7 @@ class TenantService:
             
         except Exception as e:
             logger.error(f"Error creating tenant: {str(e)}")
-            await log_security_event(
+            log_security_event(
                 event_type="TENANT_CREATION_ERROR",
                 details={
                     "name": name,
@@ -95,7 +95,7 @@ class TenantService:
         """
         tenant = await self.tenant_repo.get_active_tenant(tenant_id)
         if not tenant:
-            await log_security_event(
+            log_security_event(
                 event_type="TENANT_ACCESS_ERROR",
                 tenant_id=str(tenant_id),
                 details={"error": "Tenant not found or inactive"},
@@ -130,7 +130,7 @@ class TenantService:
                 tenant_id = await self.create_tenant(name=tenant_name)
                 tenant = await self.tenant_repo.get_by_id(tenant_id)
                 
-                await log_security_event(
+                log_security_event(
                     event_type="TENANT_CREATED_FOR_USER",
                     tenant_id=str(tenant.id),
                     user_id=user_id,
@@ -147,7 +147,7 @@ class TenantService:
             
         except Exception as e:
             logger.error(f"Error getting/creating tenant for user {user_id}: {str(e)}")
-            await log_security_event(
+            log_security_event(
                 event_type="TENANT_USER_ASSIGNMENT_ERROR",
                 user_id=user_id,
                 details={
@@ -7,7 +7,7 @@ from typing import AsyncGenerator, Dict
 from uuid import UUID, uuid4
 from tortoise import Tortoise
 from app.core.config.test_settings import get_test_settings
-from app.core.tenancy import tenant_context
+from app.core.security.tenancy import tenant_context
 from .database_test import init_test_db, close_test_db, cleanup_test_db
 
 # Event Loop Fixture
@@ -47,7 +47,7 @@ async def initialize_tests():
         """)
         
         # Drop test database if it exists and create a new one
-        await conn.execute(f'DROP DATABASE IF EXISTS {settings.POSTGRES_DB}')
+        await conn.execute(f'DROP DATABASE IF EXISTS {settings.POSTGRES_DB} WITH (FORCE)')
         await conn.execute(f'CREATE DATABASE {settings.POSTGRES_DB}')
     finally:
         await conn.close()
@@ -83,7 +83,7 @@ async def initialize_tests():
                 AND pid <> pg_backend_pid();
             """)
             
-            await conn.execute(f'DROP DATABASE IF EXISTS {settings.POSTGRES_DB}')
+            await conn.execute(f'DROP DATABASE IF EXISTS {settings.POSTGRES_DB} WITH (FORCE)')
         finally:
             await conn.close()
 
@@ -94,7 +94,7 @@ async def cleanup_after_test():
     if Tortoise._inited:
         # Clean all tables after each test
         conn = Tortoise.get_connection("default")
-        for model in Tortoise.apps.get("models").values():
+        for model in dict(Tortoise.apps.items())["models"].values():
             if hasattr(model, "_meta") and not model._meta.abstract:
                 await conn.execute_query(f'TRUNCATE TABLE "{model._meta.db_table}" CASCADE')
 
@@ -156,10 +156,48 @@ async def test_user(test_user_data):
     finally:
         tenant_context.reset(token)
 
+@pytest_asyncio.fixture
+async def test_bot(test_user):
+    """Create a test chatbot instance owned by the test user."""
+    from app.models.bot import ChatbotInstance
+    return await ChatbotInstance.create(
+        user=test_user,
+        name="Test Bot",
+        style="fun",
+        language="en",
+        tenant_id=test_user.tenant_id
+    )
+
+@pytest_asyncio.fixture
+async def test_conversation(test_user, test_bot, tenant_context_manager):
+    """Create a test conversation."""
+    from app.models.chat import Conversation
+    async with tenant_context_manager:
+        conversation = await Conversation.create(
+            title="Test Conversation",
+            user=test_user,
+            chatbot_instance=test_bot,
+            tenant_id=test_user.tenant_id
+        )
+        return conversation
+
+@pytest_asyncio.fixture
+async def test_message(test_conversation, tenant_context_manager):
+    """Create a test message."""
+    from app.models.chat import Message
+    async with tenant_context_manager:
+        message = await Message.create(
+            conversation=test_conversation,
+            content="Test message content",
+            role="user",
+            tenant_id=test_conversation.tenant_id
+        )
+        return message
+
 @pytest_asyncio.fixture
 async def tenant_context_manager(test_tenant_id):
     """Create a tenant context manager for tests."""
-    from app.core.tenancy import tenant_context
+    from app.core.security.tenancy import tenant_context
 
     class TenantContextManager:
         async def __aenter__(self):
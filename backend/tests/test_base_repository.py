@@ -0,0 +1,140 @@
+import pytest
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from app.core.security.tenancy import tenant_context
+from app.models.chat import Message
+from app.models.user import User
+from app.repositories.base import BaseRepository
+from app.repositories.user import UserRepository
+from app.repositories.chat import MessageRepository
+
+
+@pytest.mark.asyncio
+class TestGetById:
+    """Test suite for the precomputed get_by_id query."""
+
+    async def test_plain_lookup_matches_orm(self, test_conversation):
+        """Test that get_by_id builds the same record as an ORM load."""
+        message = await Message.create(
+            conversation=test_conversation,
+            content="plain lookup",
+            role="assistant",
+            metadata={"tokens": 3, "sources": ["a", "b"]},
+            tenant_id=test_conversation.tenant_id
+        )
+        fetched = await BaseRepository(Message).get_by_id(message.id)
+        expected = await Message.get(id=message.id)
+
+        assert fetched.id == expected.id
+        assert fetched.conversation_id == expected.conversation_id
+        assert fetched.tenant_id == expected.tenant_id
+        assert fetched.content == "plain lookup"
+        assert fetched.metadata == {"tokens": 3, "sources": ["a", "b"]}
+        assert fetched.timestamp == expected.timestamp
+        assert fetched.is_active is True
+
+    async def test_plain_lookup_skips_missing_and_inactive(self, test_user):
+        """Test that unknown and soft-deleted records are not returned."""
+        repository = BaseRepository(User)
+        await test_user.soft_delete()
+
+        assert await repository.get_by_id(uuid4()) is None
+        assert await repository.get_by_id(test_user.id) is None
+
+    async def test_fetched_record_saves_as_update(self, test_user):
+        """Test that a record loaded by get_by_id is saved with an UPDATE."""
+        fetched = await BaseRepository(User).get_by_id(test_user.id)
+        fetched.first_name = "After"
+        await fetched.save()
+
+        assert await User.filter(id=test_user.id).count() == 1
+        assert (await User.get(id=test_user.id)).first_name == "After"
+
+    async def test_tenant_lookup_is_scoped_to_current_tenant(self, test_message, tenant_context_manager):
+        """Test that the tenant-scoped lookup only finds the current tenant's records."""
+        repository = MessageRepository()
+        async with tenant_context_manager:
+            fetched = await repository.get_by_id(test_message.id)
+        assert fetched.id == test_message.id
+        assert fetched.conversation_id == test_message.conversation_id
+        assert fetched.content == test_message.content
+
+        token = tenant_context.set(uuid4())
+        try:
+            assert await repository.get_by_id(test_message.id) is None
+        finally:
+            tenant_context.reset(token)
+
+    async def test_tenant_lookup_decodes_json_and_skips_inactive(self, test_conversation, tenant_context_manager):
+        """Test that JSON columns are decoded and soft-deleted records are skipped."""
+        repository = MessageRepository()
+        async with tenant_context_manager:
+            message = await Message.create(
+                conversation=test_conversation,
+                content="with metadata",
+                role="assistant",
+                metadata={"tokens": 7, "nested": {"ok": True}},
+                tenant_id=test_conversation.tenant_id
+            )
+            fetched = await repository.get_by_id(message.id)
+            assert fetched.metadata == {"tokens": 7, "nested": {"ok": True}}
+
+            await message.soft_delete()
+            assert await repository.get_by_id(message.id) is None
+
+
+@pytest.mark.asyncio
+class TestUpdateReturning:
+    """Test suite for the single-statement update_returning."""
+
+    async def test_updates_and_returns_record(self, test_user, tenant_context_manager):
+        """Test that the returned record holds the new values and they are stored."""
+        last_login = datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc)
+        async with tenant_context_manager:
+            updated = await UserRepository().update_returning(
+                test_user.id,
+                first_name="Updated",
+                is_superuser=True,
+                last_login=last_login
+            )
+
+        assert updated.id == test_user.id
+        assert updated.first_name == "Updated"
+        assert updated.is_superuser is True
+        assert updated.last_login == last_login
+        assert updated.email == test_user.email
+        assert updated.updated_at > test_user.updated_at
+
+        stored = await User.get(id=test_user.id)
+        assert stored.first_name == "Updated"
+        assert stored.last_login == last_login
+        assert stored.updated_at == updated.updated_at
+
+    async def test_encodes_json_fields(self, test_message, tenant_context_manager):
+        """Test that JSON values are encoded on the way in and decoded on the way out."""
+        async with tenant_context_manager:
+            updated = await MessageRepository().update_returning(
+                test_message.id,
+                metadata={"tokens": 9, "flags": [True, False]}
+            )
+
+        assert updated.metadata == {"tokens": 9, "flags": [True, False]}
+        assert (await Message.get(id=test_message.id)).metadata == {"tokens": 9, "flags": [True, False]}
+
+    async def test_other_tenant_gets_none_and_no_change(self, test_user):
+        """Test that a record of another tenant is neither returned nor updated."""
+        token = tenant_context.set(uuid4())
+        try:
+            assert await UserRepository().update_returning(test_user.id, first_name="Hijacked") is None
+        finally:
+            tenant_context.reset(token)
+
+        assert (await User.get(id=test_user.id)).first_name == test_user.first_name
+
+    async def test_inactive_record_is_not_updated(self, test_user, tenant_context_manager):
+        """Test that soft-deleted records are not updated."""
+        await test_user.soft_delete()
+        async with tenant_context_manager:
+            assert await UserRepository().update_returning(test_user.id, first_name="Back") is None
+        assert (await User.get(id=test_user.id)).first_name == test_user.first_name
@@ -2,47 +2,23 @@ import pytest
 import pytest_asyncio
 from uuid import UUID
 from datetime import datetime
-from app.models.chat import Conversation, Message
+from app.models.chat import Conversation, Message, Feedback
 from app.models.user import User
-from app.repositories.chat import ConversationRepository, MessageRepository
-from app.core.tenancy import tenant_context
-
-
-@pytest_asyncio.fixture
-async def test_conversation(test_user, tenant_context_manager) -> Conversation:
-    """Create a test conversation."""
-    async with tenant_context_manager:
-        conversation = await Conversation.create(
-            title="Test Conversation",
-            user=test_user,
-            tenant_id=test_user.tenant_id
-        )
-        return conversation
-
-
-@pytest_asyncio.fixture
-async def test_message(test_conversation, tenant_context_manager) -> Message:
-    """Create a test message."""
-    async with tenant_context_manager:
-        message = await Message.create(
-            conversation=test_conversation,
-            content="Test message content",
-            role="user",
-            tenant_id=test_conversation.tenant_id
-        )
-        return message
+from app.repositories.chat import ChatRepository, ConversationRepository, MessageRepository, FeedbackRepository
+from app.core.security.tenancy import tenant_context
 
 
 @pytest.mark.asyncio
 class TestConversationModel:
     """Test suite for Conversation model."""
 
-    async def test_create_conversation(self, test_user, tenant_context_manager):
+    async def test_create_conversation(self, test_user, test_bot, tenant_context_manager):
         """Test conversation creation."""
         async with tenant_context_manager:
             conversation = await Conversation.create(
                 title="New Conversation",
                 user=test_user,
+                chatbot_instance=test_bot,
                 tenant_id=test_user.tenant_id
             )
             assert conversation.title == "New Conversation"
@@ -71,6 +47,15 @@ class TestConversationModel:
             assert message.metadata == {"tokens": 10}
             assert message.conversation_id == test_conversation.id
 
+    async def test_add_message_updates_last_message_at(self, test_conversation, tenant_context_manager):
+        """Test that adding a message stores its timestamp as the conversation's last_message_at."""
+        async with tenant_context_manager:
+            message = await test_conversation.add_message(content="Latest", role="assistant")
+            stored = await Conversation.get(id=test_conversation.id)
+            assert stored.last_message_at == message.timestamp
+            assert test_conversation.last_message_at == message.timestamp
+            assert await Message.filter(conversation_id=test_conversation.id).count() == 1
+
 
 @pytest.mark.asyncio
 class TestMessageModel:
@@ -113,11 +98,12 @@ class TestMessageModel:
 class TestConversationRepository:
     """Test suite for ConversationRepository."""
 
-    async def test_create_conversation(self, conversation_repository, test_user, tenant_context_manager):
+    async def test_create_conversation(self, conversation_repository, test_user, test_bot, tenant_context_manager):
         """Test conversation creation through repository."""
         async with tenant_context_manager:
             conversation = await conversation_repository.create_conversation(
                 user_id=test_user.id,
+                chatbot_instance_id=test_bot.id,
                 title="Repository Test Conversation"
             )
             assert conversation.title == "Repository Test Conversation"
@@ -138,6 +124,40 @@ class TestConversationRepository:
             assert len(conversation.messages) == 1
             assert conversation.messages[0].id == test_message.id
 
+    async def test_get_conversation_with_messages_projection(self, conversation_repository, message_repository, test_conversation, tenant_context_manager):
+        """Test that prefetched messages are ordered and skip the metadata column."""
+        async with tenant_context_manager:
+            first = await message_repository.create_message(
+                conversation_id=test_conversation.id,
+                content="first",
+                role="user",
+                metadata={"tokens": 1}
+            )
+            second = await message_repository.create_message(
+                conversation_id=test_conversation.id,
+                content="second",
+                role="assistant",
+                metadata={"tokens": 2}
+            )
+            conversation = await conversation_repository.get_conversation_with_messages(test_conversation.id)
+            messages = list(conversation.messages)
+            assert [message.id for message in messages] == [first.id, second.id]
+            assert [message.content for message in messages] == ["first", "second"]
+            assert "metadata" not in messages[0].__dict__
+
+    async def test_get_conversation_with_messages_limit(self, conversation_repository, message_repository, test_conversation, tenant_context_manager):
+        """Test that only the latest message_limit messages are prefetched, oldest first."""
+        async with tenant_context_manager:
+            created = await message_repository.bulk_create_messages([
+                {"conversation_id": test_conversation.id, "content": f"message {index}", "role": "user"}
+                for index in range(5)
+            ])
+            conversation = await conversation_repository.get_conversation_with_messages(
+                test_conversation.id,
+                message_limit=3
+            )
+            assert [message.id for message in conversation.messages] == [message.id for message in created[2:]]
+
 
 @pytest.mark.asyncio
 class TestMessageRepository:
@@ -182,4 +202,105 @@ class TestMessageRepository:
 
             # Count assistant messages
             count = await message_repository.count_messages(test_conversation.id, role="assistant")
-            assert count == 0 
\ No newline at end of file
+            assert count == 0 
+    async def test_bulk_create_messages_round_trip(self, message_repository, test_conversation, tenant_context_manager):
+        """Test that bulk-created messages read back through the ORM unchanged and in order."""
+        async with tenant_context_manager:
+            created = await message_repository.bulk_create_messages([
+                {"conversation_id": test_conversation.id, "content": "question", "role": "user"},
+                {
+                    "conversation_id": test_conversation.id,
+                    "content": "answer",
+                    "role": "assistant",
+                    "metadata": {"tokens": 42, "model": "test", "nested": {"ok": True}}
+                },
+            ])
+            stored = await Message.filter(conversation_id=test_conversation.id).order_by("timestamp")
+            assert [message.id for message in stored] == [message.id for message in created]
+            assert [message.content for message in stored] == ["question", "answer"]
+            assert stored[0].metadata is None
+            assert stored[1].metadata == {"tokens": 42, "model": "test", "nested": {"ok": True}}
+            assert all(message.tenant_id == test_conversation.tenant_id for message in stored)
+            assert stored[0].timestamp < stored[1].timestamp
+
+    async def test_bulk_created_message_can_be_updated(self, message_repository, test_conversation, tenant_context_manager):
+        """Test that a bulk-created message is treated as saved, so save() updates it."""
+        async with tenant_context_manager:
+            message, = await message_repository.bulk_create_messages([
+                {"conversation_id": test_conversation.id, "content": "draft", "role": "user"}
+            ])
+            message.content = "edited"
+            await message.save()
+            stored = await Message.filter(conversation_id=test_conversation.id)
+            assert len(stored) == 1
+            assert stored[0].content == "edited"
+
+    async def test_get_conversation_messages_returns_latest(self, message_repository, test_conversation, tenant_context_manager):
+        """Test that the limit keeps the latest messages and returns them oldest first."""
+        async with tenant_context_manager:
+            created = await message_repository.bulk_create_messages([
+                {"conversation_id": test_conversation.id, "content": f"message {index}", "role": "user"}
+                for index in range(5)
+            ])
+            messages = await message_repository.get_conversation_messages(test_conversation.id, limit=3)
+            assert [message.id for message in messages] == [message.id for message in created[2:]]
+
+            # Page backwards from the oldest message returned
+            older = await message_repository.get_conversation_messages(
+                test_conversation.id,
+                limit=3,
+                before_timestamp=messages[0].timestamp
+            )
+            assert [message.id for message in older] == [message.id for message in created[:2]]
+
+
+@pytest.mark.asyncio
+class TestFeedbackRepository:
+    """Test suite for FeedbackRepository."""
+
+    async def test_create_feedback(self, chat_repository, test_user, test_message, tenant_context_manager):
+        """Test that feedback is stored for the current tenant and reads back unchanged."""
+        async with tenant_context_manager:
+            feedback = await chat_repository.create_feedback(
+                message_id=test_message.id,
+                user_id=test_user.id,
+                rating=4,
+                comment="Helpful"
+            )
+
+        stored = await Feedback.get(id=feedback.id)
+        assert stored.message_id == test_message.id
+        assert stored.user_id == test_user.id
+        assert stored.rating == 4
+        assert stored.comment == "Helpful"
+        assert stored.tenant_id == test_message.tenant_id
+        assert stored.is_active
+        assert stored.created_at == feedback.created_at
+
+
+class TestChatRepository:
+    """Test suite for ChatRepository construction."""
+
+    def test_uses_injected_repositories(self):
+        """Test that repositories passed to the constructor are used as given."""
+        conversation_repo = ConversationRepository()
+        message_repo = MessageRepository()
+        feedback_repo = FeedbackRepository()
+        repository = ChatRepository(
+            conversation_repo=conversation_repo,
+            message_repo=message_repo,
+            feedback_repo=feedback_repo
+        )
+        assert repository.conversation_repo is conversation_repo
+        assert repository.message_repo is message_repo
+        assert repository.feedback_repo is feedback_repo
+
+    def test_shares_repositories_by_default(self):
+        """Test that ChatRepository instances share one repository of each kind by default."""
+        first, second = ChatRepository(), ChatRepository()
+        assert isinstance(first.conversation_repo, ConversationRepository)
+        assert isinstance(first.message_repo, MessageRepository)
+        assert isinstance(first.feedback_repo, FeedbackRepository)
+        assert first.conversation_repo is second.conversation_repo
+        assert first.message_repo is second.message_repo
+        assert first.feedback_repo is second.feedback_repo
@@ -1,5 +1,5 @@
 import pytest
-from httpx import AsyncClient
+from httpx import AsyncClient, ASGITransport
 from uuid import uuid4
 from datetime import datetime
 
@@ -9,7 +9,7 @@ from app.api.deps import get_chat_service
 from app.core.security.tenancy import require_tenant
 
 class DummyChatService:
-    async def process_message(self, user_id, tenant_id, message, conversation_id=None):
+    async def process_message(self, user_id, tenant_id, chatbot_instance_id, message, conversation_id=None):
         return {
             "message_id": uuid4(),
             "conversation_id": uuid4(),
@@ -21,7 +21,7 @@ class DummyChatService:
 
 @pytest.fixture
 def override_dependencies():
-    app.dependency_overrides[get_current_user] = lambda: UserToken(sub="user", tenant_id=str(uuid4()))
+    app.dependency_overrides[get_current_user] = lambda: UserToken(sub=str(uuid4()), preferred_username="user", tenant_id=str(uuid4()))
     app.dependency_overrides[get_current_user_roles] = lambda: ["user"]
     app.dependency_overrides[require_tenant] = lambda: uuid4()
 
@@ -34,10 +34,10 @@ def override_dependencies():
 
 @pytest.mark.asyncio
 async def test_send_message_endpoint(override_dependencies):
-    async with AsyncClient(app=app, base_url="http://test") as ac:
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
         response = await ac.post(
             "/api/v1/chat/",
-            json={"message": "Hi"},
+            json={"message": "Hi", "chatbot_instance_id": str(uuid4())},
             headers={"X-Tenant-ID": str(uuid4()), "Authorization": "Bearer token"},
         )
         assert response.status_code == 201
@@ -8,11 +8,16 @@ class DummyAIService:
     async def generate_response(self, *args, **kwargs):
         return "ok"
 
+class DummyPromptFilterService:
+    async def filter_prompt(self, content, *args, **kwargs):
+        raise AssertionError("prompt filter not expected in these tests")
+
 @pytest_asyncio.fixture
 async def chat_service(chat_repository) -> ChatService:
     return ChatService(
         chat_repository=chat_repository,
         ai_service=DummyAIService(),
+        prompt_filter_service=DummyPromptFilterService(),
         settings=get_test_settings(),
     )
 
@@ -0,0 +1,87 @@
+import pytest
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse
+from httpx import ASGITransport, AsyncClient
+from starlette.middleware import Middleware
+
+from app.core.middleware import FastPathMiddleware
+
+
+class _RecordingMiddleware:
+    def __init__(self, app, seen):
+        self.app = app
+        self.seen = seen
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            self.seen.append(scope["path"])
+        await self.app(scope, receive, send)
+
+
+class _TeapotError(Exception):
+    pass
+
+
+def _build_app(seen):
+    app = FastAPI(middleware=[
+        Middleware(FastPathMiddleware, fast_paths=["/fast", "/fast-error", "/fast-custom"]),
+        Middleware(_RecordingMiddleware, seen=seen),
+    ])
+
+    @app.exception_handler(_TeapotError)
+    async def teapot_handler(request: Request, exc: _TeapotError):
+        return JSONResponse(status_code=418, content={"detail": "teapot"})
+
+    @app.get("/fast")
+    async def fast():
+        return {"status": "ok"}
+
+    @app.get("/fast-error")
+    async def fast_error():
+        raise HTTPException(status_code=503, detail="unavailable")
+
+    @app.get("/fast-custom")
+    async def fast_custom():
+        raise _TeapotError()
+
+    @app.get("/slow")
+    async def slow():
+        return {"status": "ok"}
+
+    return app
+
+
+@pytest.mark.asyncio
+async def test_fast_path_skips_user_middleware():
+    seen = []
+    async with AsyncClient(transport=ASGITransport(app=_build_app(seen)), base_url="http://test") as ac:
+        fast = await ac.get("/fast")
+        slow = await ac.get("/slow")
+
+    assert fast.status_code == 200 and fast.json() == {"status": "ok"}
+    assert slow.status_code == 200
+    assert seen == ["/slow"]
+
+
+@pytest.mark.asyncio
+async def test_fast_path_keeps_exception_handlers():
+    seen = []
+    async with AsyncClient(transport=ASGITransport(app=_build_app(seen)), base_url="http://test") as ac:
+        http_error = await ac.get("/fast-error")
+        custom_error = await ac.get("/fast-custom")
+
+    assert http_error.status_code == 503
+    assert http_error.json() == {"detail": "unavailable"}
+    assert custom_error.status_code == 418
+    assert custom_error.json() == {"detail": "teapot"}
+    assert seen == []
+
+
+@pytest.mark.asyncio
+async def test_fast_path_only_applies_to_get():
+    seen = []
+    async with AsyncClient(transport=ASGITransport(app=_build_app(seen)), base_url="http://test") as ac:
+        response = await ac.post("/fast")
+
+    assert response.status_code == 405
+    assert seen == ["/fast"]
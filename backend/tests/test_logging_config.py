@@ -0,0 +1,154 @@
+import asyncio
+import logging
+import logging.config
+
+import orjson
+import pytest
+from uvicorn.config import LOGGING_CONFIG
+
+from app.core import logging_config
+
+
+class _CaptureHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+@pytest.fixture
+def fresh_logging(monkeypatch):
+    """Let setup_logging run again, restoring the root handlers afterwards."""
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    monkeypatch.setattr(logging_config, "_CONFIGURED", False)
+    yield
+    root.handlers[:] = saved_handlers
+    root.setLevel(saved_level)
+
+
+def test_uvicorn_error_records_reach_root_handler(fresh_logging):
+    # uvicorn applies its own config before importing the app
+    logging.config.dictConfig(LOGGING_CONFIG)
+    logging_config.setup_logging(environment="production")
+
+    capture = _CaptureHandler()
+    logging.getLogger().addHandler(capture)
+    logging.getLogger("uvicorn.error").info("server started")
+
+    assert [record.getMessage() for record in capture.records] == ["server started"]
+
+
+def test_stdlib_records_keep_documented_json_shape(fresh_logging):
+    logging_config.setup_logging(environment="production")
+    formatter = logging.getLogger().handlers[0].formatter
+
+    record = logging.getLogger("tortoise").makeRecord(
+        "tortoise", logging.WARNING, __file__, 1, "slow query %s", ("q1",), None
+    )
+    entry = orjson.loads(formatter.format(record))
+
+    assert entry["message"] == "slow query q1"
+    assert "event" not in entry
+    assert entry["level"] == "WARNING"
+    assert entry["logger"] == "tortoise"
+    assert entry["timestamp"].endswith("Z")
+
+
+def test_metric_helpers_log_duration_us_unchanged(monkeypatch):
+    submitted = []
+    monkeypatch.setattr(
+        logging_config, "submit_log",
+        lambda method, event, fields: submitted.append((event, fields))
+    )
+
+    logging_config.log_api_metrics("/api/v1/chat/", "POST", 201, duration_us=125512)
+    logging_config.log_performance_metrics("slow_request", duration_us=1500000)
+
+    assert [(event, fields["duration_us"]) for event, fields in submitted] == [
+        ("api_metric", 125512),
+        ("performance_metric", 1500000),
+    ]
+    assert all("duration_ms" not in fields for _, fields in submitted)
+
+
+def _recorder():
+    written = []
+
+    def method(event, **fields):
+        written.append(event)
+
+    return written, method
+
+
+def test_drain_finishes_batch_after_stop_marker():
+    written, method = _recorder()
+    log_queue = logging_config.queue.Queue()
+    for entry in [(method, "a", {}), logging_config._LOG_BATCHER_STOP, (method, "b", {})]:
+        log_queue.put(entry)
+
+    logging_config._drain_log_queue(log_queue)
+
+    assert written == ["a", "b"]
+
+
+def test_drain_reports_failed_writes_to_stderr(capsys):
+    def failing(event, **fields):
+        raise ValueError("boom")
+
+    log_queue = logging_config.queue.Queue()
+    log_queue.put((failing, "bad_event", {}))
+    log_queue.put(logging_config._LOG_BATCHER_STOP)
+
+    logging_config._drain_log_queue(log_queue)
+
+    assert "bad_event" in capsys.readouterr().err
+
+
+@pytest.mark.asyncio
+async def test_stop_with_full_queue_does_not_hang_or_drop(monkeypatch):
+    monkeypatch.setattr(logging_config, "LOG_QUEUE_MAXSIZE", 2)
+    monkeypatch.setattr(logging_config, "LOG_BATCHER_STOP_TIMEOUT", 0.1)
+    release = logging_config.threading.Event()
+    written, record = _recorder()
+
+    def blocking(event, **fields):
+        release.wait()
+        written.append(event)
+
+    logging_config.start_log_batcher()
+    log_queue, thread = logging_config._log_queue, logging_config._log_thread
+    logging_config.submit_log(blocking, "first", {})
+    while log_queue.qsize():
+        await asyncio.sleep(0.01)
+    # The batcher is stuck on "first"; fill the queue behind it
+    logging_config.submit_log(record, "second", {})
+    logging_config.submit_log(record, "third", {})
+    assert log_queue.full()
+
+    await logging_config.stop_log_batcher()
+    assert written == ["second", "third"]
+
+    release.set()
+    log_queue.put(logging_config._LOG_BATCHER_STOP)
+    thread.join(1)
+    assert written == ["second", "third", "first"]
+
+
+@pytest.mark.asyncio
+async def test_submit_logs_inline_when_batcher_thread_is_gone():
+    written, record = _recorder()
+    logging_config.start_log_batcher()
+    try:
+        # The thread exits while the batcher is still registered
+        logging_config._log_queue.put(logging_config._LOG_BATCHER_STOP)
+        logging_config._log_thread.join(1)
+
+        logging_config.submit_log(record, "late_event", {})
+
+        assert written == ["late_event"]
+    finally:
+        await logging_config.stop_log_batcher()
+    assert written == ["late_event"]
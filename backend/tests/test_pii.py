@@ -0,0 +1,43 @@
+import pytest
+
+from app.core.security.pii import DataMasker, PIIDetector
+
+
+@pytest.fixture
+def mask():
+    detector = PIIDetector()
+    masker = DataMasker()
+
+    def _mask(text):
+        return masker.mask_text(text, detector.detect_regex_pii(text))
+
+    return _mask
+
+
+@pytest.mark.parametrize("text,expected", [
+    ("My SSN is 123-45-6789", "My SSN is [SSN]"),
+    ("card 4111 1111 1111 1111 ok", "card [CREDIT_CARD] ok"),
+    ("call 555-123-4567", "call [PHONE]"),
+    ("server 192.168.100.200", "server [IP_ADDRESS]"),
+    ("mail ana@example.hr", "mail [EMAIL]"),
+])
+def test_masks_single_pii(mask, text, expected):
+    assert mask(text) == expected
+
+
+@pytest.mark.parametrize("text,expected", [
+    # A phone number starting earlier must not hide an overlapping card number
+    ("508 655-9051-123545979904", "508 655-[CREDIT_CARD]"),
+    ("212-555-1234 5678 9012 3456", "212-555-[CREDIT_CARD]"),
+    # Nor an IP address an overlapping SSN
+    ("1.2.3.123-45-6789", "1.2.3.[SSN]"),
+    # Equal priorities: the earlier match wins
+    ("192.168.100.200-4567", "[IP_ADDRESS]-4567"),
+])
+def test_overlapping_matches_prefer_higher_priority(mask, text, expected):
+    assert mask(text) == expected
+
+
+def test_masks_all_non_overlapping_matches(mask):
+    text = "SSN 123-45-6789, card 4111-1111-1111-1111, ip 10.0.0.1, call 555-123-4567"
+    assert mask(text) == "SSN [SSN], card [CREDIT_CARD], ip [IP_ADDRESS], call [PHONE]"
@@ -0,0 +1,59 @@
+from unittest import mock
+
+import pytest
+
+from app.core.middleware import request_logging
+from app.core.middleware.request_logging import RequestLoggingMiddleware
+
+
+def _http_scope(path):
+    return {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "query_string": b"",
+        "headers": [],
+        "client": ("127.0.0.1", 1234),
+    }
+
+
+async def _ok_app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+
+async def _receive():
+    return {"type": "http.request", "body": b""}
+
+
+@pytest.mark.asyncio
+async def test_excluded_path_skips_request_parsing():
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    middleware = RequestLoggingMiddleware(_ok_app, exclude_paths=["/api/v1/healthz"])
+    with mock.patch.object(request_logging, "Request") as request_cls, \
+            mock.patch.object(request_logging, "log_api_metrics") as log_api_metrics:
+        await middleware(_http_scope("/api/v1/healthz"), _receive, send)
+
+    request_cls.assert_not_called()
+    log_api_metrics.assert_not_called()
+    assert sent[0]["status"] == 200
+
+
+@pytest.mark.asyncio
+async def test_logged_path_records_api_metrics():
+    async def send(message):
+        pass
+
+    middleware = RequestLoggingMiddleware(_ok_app, exclude_paths=["/api/v1/healthz"])
+    with mock.patch.object(request_logging, "log_api_metrics") as log_api_metrics:
+        await middleware(_http_scope("/api/v1/chat/"), _receive, send)
+
+    log_api_metrics.assert_called_once()
+    assert log_api_metrics.call_args.kwargs["status_code"] == 200
+    assert log_api_metrics.call_args.kwargs["endpoint"] == "/api/v1/chat/"
+    duration_us = log_api_metrics.call_args.kwargs["duration_us"]
+    assert isinstance(duration_us, int) and duration_us >= 0
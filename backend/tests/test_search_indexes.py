@@ -0,0 +1,39 @@
+from unittest import mock
+
+import pytest
+
+from app.core import database, search_indexes
+
+
+@pytest.mark.asyncio
+async def test_startup_does_not_create_search_indexes():
+    connection = mock.AsyncMock()
+    with mock.patch.object(database.Tortoise, "init", mock.AsyncMock()), \
+            mock.patch.object(database.Tortoise, "generate_schemas", mock.AsyncMock()), \
+            mock.patch.object(database.Tortoise, "get_connection", return_value=connection):
+        await database.initialize_database()
+
+    connection.execute_script.assert_not_called()
+    assert not hasattr(database, "create_search_indexes")
+
+
+@pytest.mark.asyncio
+async def test_create_search_indexes_runs_each_statement_separately():
+    connection = mock.AsyncMock()
+    with mock.patch.object(search_indexes.Tortoise, "get_connection", return_value=connection):
+        await search_indexes.create_search_indexes()
+
+    statements = [call.args[0] for call in connection.execute_script.await_args_list]
+    assert statements == list(search_indexes.SEARCH_INDEXES_SQL)
+    assert statements[0] == "CREATE EXTENSION IF NOT EXISTS pg_trgm"
+
+
+@pytest.mark.asyncio
+async def test_main_closes_connections_when_index_creation_fails():
+    with mock.patch.object(search_indexes, "initialize_database", mock.AsyncMock()), \
+            mock.patch.object(search_indexes, "create_search_indexes", mock.AsyncMock(side_effect=RuntimeError)), \
+            mock.patch.object(search_indexes, "close_database_connection", mock.AsyncMock()) as close:
+        with pytest.raises(RuntimeError):
+            await search_indexes.main()
+
+    close.assert_awaited_once()
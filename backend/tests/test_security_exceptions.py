@@ -0,0 +1,37 @@
+import threading
+from unittest import mock
+
+import pytest
+
+from app.core.security import exceptions
+from app.core.security.exceptions import AuthenticationError, RateLimitError
+from app.services.auth import get_current_user
+
+
+def test_status_code_comes_from_class():
+    assert AuthenticationError("Invalid token").status_code == 401
+    assert RateLimitError("Rate limit exceeded").status_code == 429
+
+
+def test_security_event_logged_outside_event_loop():
+    """Exceptions built in sync or threadpool code still log their event."""
+    with mock.patch.object(exceptions, "log_security_event") as log_event:
+        thread = threading.Thread(target=AuthenticationError, args=("Invalid token",))
+        thread.start()
+        thread.join()
+
+    log_event.assert_called_once()
+    assert log_event.call_args.kwargs["error_type"] == "AuthenticationError"
+    assert log_event.call_args.kwargs["error_message"] == "Invalid token"
+
+
+@pytest.mark.asyncio
+async def test_missing_token_raises_fresh_exception():
+    raised = []
+    for _ in range(2):
+        with pytest.raises(AuthenticationError) as exc_info:
+            await get_current_user("")
+        raised.append(exc_info.value)
+
+    assert raised[0] is not raised[1]
+    assert raised[0].status_code == 401
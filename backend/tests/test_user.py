@@ -3,7 +3,7 @@ import pytest_asyncio
 from uuid import UUID
 from app.models.user import User
 from app.repositories.user import UserRepository
-from app.core.tenancy import tenant_context
+from app.core.security.tenancy import tenant_context
 
 
 @pytest_asyncio.fixture
@@ -29,7 +29,7 @@ class TestUserModel:
             user = await User.create(**user_data)
             assert user.username == test_user_data["username"]
             assert user.email == test_user_data["email"]
-            assert user.verify_password(test_user_data["password"])
+            assert await user.verify_password(test_user_data["password"])
             assert user.tenant_id == test_user_data["tenant_id"]
 
     async def test_get_by_email(self, test_user, test_user_data, tenant_context_manager):
@@ -47,8 +47,8 @@ class TestUserModel:
     async def test_verify_password(self, test_user, test_user_data, tenant_context_manager):
         """Test password verification."""
         async with tenant_context_manager:
-            assert test_user.verify_password(test_user_data["password"])
-            assert not test_user.verify_password("wrong_password")
+            assert await test_user.verify_password(test_user_data["password"])
+            assert not await test_user.verify_password("wrong_password")
 
     async def test_full_name(self, test_user, test_user_data, tenant_context_manager):
         """Test full name property."""
@@ -87,7 +87,7 @@ class TestUserRepository:
             )
             assert user.username == test_user_data["username"]
             assert user.email == test_user_data["email"]
-            assert user.verify_password(test_user_data["password"])
+            assert await user.verify_password(test_user_data["password"])
 
     async def test_get_by_email(self, user_repository, test_user, test_user_data, tenant_context_manager):
         """Test getting user by email through repository."""
@@ -106,7 +106,7 @@ class TestUserRepository:
         async with tenant_context_manager:
             new_password = "new_password123"
             updated_user = await user_repository.update_password(test_user.id, new_password)
-            assert updated_user.verify_password(new_password)
+            assert await updated_user.verify_password(new_password)
 
     async def test_search_users(self, user_repository, test_user, test_user_data, tenant_context_manager):
         """Test searching users."""